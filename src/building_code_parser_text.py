@@ -6,82 +6,242 @@ Handles Division, Part, Section, Article, Subarticle, and Clauses structure
 
 import re
 import json
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass, field
+import mmap
+import os
+import multiprocessing
+from itertools import chain
+from collections.abc import Mapping
+from concurrent.futures import ProcessPoolExecutor
+try:
+    # RE2 matches in linear time; patterns handed to it must avoid lookarounds and
+    # backreferences. Without google-re2 installed the stdlib engine is used instead.
+    import re2
+except ImportError:
+    import re as re2
+from typing import Dict, List, Any, Optional, Iterator, Tuple
+from dataclasses import dataclass, field, asdict
 
-@dataclass
+@dataclass(slots=True)
 class Clause:
     """Represents a clause within a subarticle"""
     number: str  # e.g., "1)", "2)", "a)", "b)", "i)", "ii)"
-    content: str
+    start: int  # text span within the parsed source
+    end: int
     sub_clauses: list['Clause'] = field(default_factory=list)
+    source: str = field(default='', repr=False, compare=False)
+    
+    @property
+    def content(self) -> str:
+        return self.source[self.start:self.end]
 
-@dataclass
+@dataclass(slots=True)
 class Subarticle:
     """Represents a subarticle within an article"""
     number: str  # e.g., "9.1.1.1"
     title: str
-    content: str
+    start: int
+    end: int
     clauses: list[Clause] = field(default_factory=list)
+    source: str = field(default='', repr=False, compare=False)
+    
+    @property
+    def content(self) -> str:
+        return self.source[self.start:self.end]
 
-@dataclass
+@dataclass(slots=True)
 class Article:
     """Represents an article within a section"""
     number: str  # e.g., "9.1.1"
     title: str
-    content: str
+    start: int
+    end: int
     subarticles: list[Subarticle] = field(default_factory=list)
+    source: str = field(default='', repr=False, compare=False)
+    
+    @property
+    def content(self) -> str:
+        return self.source[self.start:self.end]
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """Represents a section within a part"""
     number: str  # e.g., "9.1"
     title: str
-    content: str
+    start: int
+    end: int
     articles: list[Article] = field(default_factory=list)
+    source: str = field(default='', repr=False, compare=False)
+    
+    @property
+    def content(self) -> str:
+        return self.source[self.start:self.end]
 
-@dataclass
+@dataclass(slots=True)
 class Part:
     """Represents a part within a division"""
     number: str  # e.g., "9"
     title: str
-    content: str
+    start: int
+    end: int
     sections: list[Section] = field(default_factory=list)
+    source: str = field(default='', repr=False, compare=False)
+    
+    @property
+    def content(self) -> str:
+        return self.source[self.start:self.end]
 
-@dataclass
+@dataclass(slots=True)
 class Division:
     """Represents a division of the building code"""
     letter: str  # e.g., "A", "B", "C"
-    content: str
+    start: int
+    end: int
     parts: list[Part] = field(default_factory=list)
+    source: str = field(default='', repr=False, compare=False)
+    
+    @property
+    def content(self) -> str:
+        return self.source[self.start:self.end]
+
+@dataclass(slots=True)
+class Measurement(Mapping):
+    """A measurement found in the code text, read-only mapping of value, unit, context and full_match"""
+    value: float
+    unit: str
+    start: int  # span of the match within the parsed source
+    end: int
+    context_start: int  # span of the surrounding text
+    context_end: int
+    source: str = field(default='', repr=False, compare=False)
+    
+    _KEYS = ('value', 'unit', 'context', 'full_match')
+    
+    @property
+    def context(self) -> str:
+        return self.source[self.context_start:self.context_end].strip()
+    
+    @property
+    def full_match(self) -> str:
+        return self.source[self.start:self.end]
+    
+    def __getitem__(self, key: str) -> Any:
+        if key not in self._KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._KEYS)
+    
+    def __len__(self) -> int:
+        return len(self._KEYS)
 
-@dataclass
+@dataclass(slots=True)
 class BuildingCodeStructure:
     """Complete building code structure"""
     divisions: List[Division]
-    measurements: List[Dict[str, Any]]
+    measurements: List[Measurement]
     requirements: List[str]
+    # Text the node spans point into; nodes hold a reference instead of their own copies
+    source: str = field(default='', repr=False, compare=False)
 
 class OntarioBuildingCodeParserfromtext:
     """Parser for Ontario Building Code text files"""
     
+    # Files at least this large are memory-mapped instead of read through a text stream
+    MMAP_THRESHOLD = 1024 * 1024
+    # Inputs at least this large parse their divisions in a process pool
+    PARALLEL_THRESHOLD = 512 * 1024
+    
+    # Token level by the named group of _re_header that matched
+    _HEADER_LEVELS = {'division': 0, 'part': 1, 'section': 2, 'article': 3, 'subarticle': 4, 'clause': 5}
+    _PLAIN_TITLE_START = frozenset(map(chr, range(33, 127))) - frozenset('DPS0123456789')
+    
+    # Unit spellings captured by the measurement pattern, keyed in lower case
+    _UNIT_MAP = {
+        'feet': 'feet', 'ft': 'feet',
+        'meters': 'meters', 'meter': 'meters', 'm': 'meters',
+        'inches': 'inches', 'inch': 'inches', 'in': 'inches',
+        'mm': 'millimeters',
+        'cm': 'centimeters',
+        'kpa': 'kilopascals',
+        'mpa': 'megapascals',
+        'kn': 'kilonewtons',
+        'kg': 'kilograms',
+    }
+    
     def __init__(self):
-        self.structure = None
-        self.measurement_patterns = [
-            r'(\d+(?:\.\d+)?)\s*(?:feet|ft|meters?|m|inches?|in|mm|cm|kPa|MPa|kN|kg)\b',
-            r'minimum\s+(\d+(?:\.\d+)?)\s*(?:feet|ft|meters?|m|inches?|in|mm|cm|kPa|MPa|kN|kg)\b',
-            r'maximum\s+(\d+(?:\.\d+)?)\s*(?:feet|ft|meters?|m|inches?|in|mm|cm|kPa|MPa|kN|kg)\b',
-            r'not\s+less\s+than\s+(\d+(?:\.\d+)?)\s*(?:feet|ft|meters?|m|inches?|in|mm|cm|kPa|MPa|kN|kg)\b',
-            r'not\s+more\s+than\s+(\d+(?:\.\d+)?)\s*(?:feet|ft|meters?|m|inches?|in|mm|cm|kPa|MPa|kN|kg)\b',
-            r'(\d+(?:\.\d+)?)\s*(?:kPa|MPa|kN|kg)\b',
-            r'(\d+(?:\.\d+)?)\s*(?:mm|cm)\b'
-        ]
+        self._structure = None
+        self._indexes = None
+        self._requirements_lower = None
+        self._measurements_by_unit = None
+        # Clause markers ("1)", "a)", "ii)") repeat across the whole code; keep one string per marker
+        self._number_intern: Dict[str, str] = {}
+        # One alternation covers the plain and the minimum/maximum/not less than/not more than
+        # forms, so each measurement is matched once and the unit is captured in group 2
+        self.measurement_pattern = (
+            r'(?:(?:minimum|maximum|not\s+less\s+than|not\s+more\s+than)\s+)?'
+            r'(\d+(?:\.\d+)?)\s*(feet|ft|meters?|m|inches?|in|mm|cm|kPa|MPa|kN|kg)\b'
+        )
+        
+        # Compile every pattern once. All structural headers (number and title line) and
+        # every line opening with a clause marker are found by one alternation in a single
+        # pass over the text. Each alternative is a named group, so match.lastgroup tells
+        # the level (see _HEADER_LEVELS); bodies are the text between consecutive tokens.
+        clause_mark = r'(?:\d+|[ivx]+|[a-z])\)'
+        headers = (
+            r'(?:(?P<division>Division\s+(?P<division_number>[A-Z])\s*$)'
+            r'|(?P<part>Part\s+(?P<part_number>\d+)\s*\n(?P<part_title>[^\n]+))'
+            r'|(?P<section>Section\s+(?P<section_number>\d+\.\d+)\s*\.?\s*\n(?P<section_title>[^\n]+))'
+            r'|(?P<article>(?P<article_number>\d+\.\d+\.\d+)\s*\.?\s*\n(?P<article_title>[^\n]+))'
+            r'|(?P<subarticle>(?P<subarticle_number>\d+\.\d+\.\d+\.\d+)\s*\.?\s*\n(?P<subarticle_title>[^\n]+))'
+            r'|(?P<clause>(?P<clause_number>' + clause_mark + r')))'
+        )
+        # The scan resumes from arbitrary positions, which the RE2 binding handles by
+        # re-encoding the whole text on every call, so headers use the stdlib engine
+        self._re_header = re.compile(r'(?m)^' + headers)
+        # Unanchored form for a header indented on the first line of a body
+        self._re_header_unanchored = re.compile(r'(?m)' + headers)
+        self._re_blank = re.compile(r'\s*')
+        # Group numbers of the number and title of each level (-1 when there is no title)
+        group_index = self._re_header.groupindex
+        self._header_groups = {name: (group_index[name + '_number'], group_index.get(name + '_title', -1))
+                               for name in self._HEADER_LEVELS}
+        # A clause made of a single sub-clause ("1) a) ...") is split by this pattern;
+        # it needs lookarounds, so it stays on the stdlib engine.
+        sub_clause_mark = r'(?:[ivx]+|[a-z])\)'
+        self._re_subclause = re.compile(
+            r'^([ivx]+\)|[a-hj-uwyz]\))\s+((?<=\n)(?=' + sub_clause_mark + r')|'
+            r'[^\n]*(?:\n(?!' + sub_clause_mark + r')[^\n]*)*)', re.MULTILINE)
+        self._re_measurement = re2.compile('(?i)' + self.measurement_pattern)
+        # (keyword, pattern) pairs; the keyword is a cheap substring check that lets
+        # divisions without it skip the regex scan entirely
+        self._req_patterns = [(keyword, re2.compile(r'(?i)\b' + keyword + r'\s+[^.]*\.'))
+                              for keyword in ('shall', 'must', 'required', 'mandatory', 'conform', 'comply')]
+    
+    @property
+    def structure(self) -> Optional[BuildingCodeStructure]:
+        return self._structure
+    
+    @structure.setter
+    def structure(self, value: Optional[BuildingCodeStructure]):
+        # Lookup indexes describe the old tree, rebuild them on next use
+        self._structure = value
+        self._indexes = None
+        self._requirements_lower = None
+        self._measurements_by_unit = None
     
     def parse_file(self, file_path: str) -> BuildingCodeStructure:
         """Parse a building code text file"""
         try:
-            with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
-                content = file.read()
+            try:
+                size = os.path.getsize(file_path)
+            except OSError:
+                size = 0  # let open() report missing files below
+            if size >= self.MMAP_THRESHOLD:
+                content = self._read_mapped(file_path)
+            else:
+                with open(file_path, 'r', encoding='utf-8', errors='ignore') as file:
+                    content = file.read()
             return self.parse_content(content)
         except FileNotFoundError:
             print(f"File not found: {file_path}")
@@ -90,6 +250,15 @@ class OntarioBuildingCodeParserfromtext:
             print(f"Error reading file: {e}")
             return None
     
+    def _read_mapped(self, file_path: str) -> str:
+        """Decode a file directly from a memory map without an intermediate bytes copy"""
+        with open(file_path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            content = str(mapped, 'utf-8', 'ignore')
+        if '\r' in content:
+            # Apply the newline translation text mode would have done
+            content = content.replace('\r\n', '\n').replace('\r', '\n')
+        return content
+    
     def parse_content(self, content: str) -> BuildingCodeStructure:
         """Parse building code content with Ontario Building Code structure"""
         divisions = []
@@ -97,183 +266,161 @@ class OntarioBuildingCodeParserfromtext:
         all_requirements = []
         
         # Split content by divisions
-        division_pattern = r'^Division\s+([A-Z])\s*\n(.*?)(?=^Division\s+[A-Z]|\Z)'
-        division_matches = re.finditer(division_pattern, content, re.MULTILINE | re.DOTALL)
-        
-        for div_match in division_matches:
-            div_letter = div_match.group(1)
-            div_content = div_match.group(2).strip()
-            
-            # Parse parts within division
-            parts = self._parse_parts(div_content)
-            
-            division = Division(
-                letter=div_letter,
-                content=div_content,
-                parts=parts
-            )
+        tokens = self._tokenize_headers(content)
+        divisions_raw = [(content[token[3]:token[4]], content[start:end], start, inner)
+                         for token, start, end, inner in self._split_on_token(content, 0, tokens, 0, len(content))]
+        
+        # Divisions share no state, so large inputs parse them in separate processes
+        workers = min(len(divisions_raw), os.cpu_count() or 1)
+        if workers > 1 and len(content) >= self.PARALLEL_THRESHOLD:
+            chunksize = max(1, len(divisions_raw) // (workers * 4))
+            # Workers are spawned; forking a multi-threaded process such as the GUI is unsafe
+            with ProcessPoolExecutor(max_workers=workers,
+                                     mp_context=multiprocessing.get_context('spawn')) as executor:
+                results = list(executor.map(_parse_division_worker, divisions_raw, chunksize=chunksize))
+        else:
+            results = [self._parse_division(*division_raw) for division_raw in divisions_raw]
+        
+        for division, div_measurements, div_requirements in results:
             divisions.append(division)
-            
-            # Extract measurements and requirements from this division
-            div_measurements = self._extract_measurements(div_content)
-            div_requirements = self._extract_requirements(div_content)
-            
             all_measurements.extend(div_measurements)
             all_requirements.extend(div_requirements)
         
+        self._attach_source(divisions, all_measurements, content)
+        
         self.structure = BuildingCodeStructure(
             divisions=divisions,
             measurements=all_measurements,
-            requirements=all_requirements
+            requirements=all_requirements,
+            source=content
         )
         
         return self.structure
     
-    def _parse_parts(self, content: str) -> List[Part]:
-        """Parse parts within division content"""
-        parts = []
+    def _parse_division(self, div_letter: str, div_content: str, base: int, tokens: List[Tuple[int, ...]]) -> Tuple[Division, List[Measurement], List[str]]:
+        """Parse one division starting at offset base and extract its measurements and requirements"""
+        # Assemble parts, sections, articles, subarticles and clauses from the tokens
+        division = _build_tree(div_letter, tokens, div_content, base, self._parse_sub_clauses, self._number_intern)
         
-        # Pattern to match "Part X" followed by title and content
-        part_pattern = r'^Part\s+(\d+)\s*\n([^\n]+)\s*\n(.*?)(?=^Part\s+\d+|\Z)'
-        part_matches = re.finditer(part_pattern, content, re.MULTILINE | re.DOTALL)
+        # Extract measurements and requirements from this division
+        div_measurements = self._extract_measurements(div_content, base)
+        div_requirements = self._extract_requirements(div_content)
         
-        for part_match in part_matches:
-            part_num = part_match.group(1)
-            part_title = part_match.group(2).strip()
-            part_content = part_match.group(3).strip()
-            
-            # Parse sections within part
-            sections = self._parse_sections(part_content)
-            
-            part = Part(
-                number=part_num,
-                title=part_title,
-                content=part_content,
-                sections=sections
-            )
-            parts.append(part)
-        
-        return parts
+        return division, div_measurements, div_requirements
     
-    def _parse_sections(self, content: str) -> List[Section]:
-        """Parse sections within part content"""
-        sections = []
-        
-        # Pattern to match "Section X.Y" followed by title and content
-        section_pattern = r'^Section\s+(\d+\.\d+)\s*\.?\s*\n([^\n]+)\s*\n(.*?)(?=^Section\s+\d+\.\d+|\Z)'
-        section_matches = re.finditer(section_pattern, content, re.MULTILINE | re.DOTALL)
-        
-        for section_match in section_matches:
-            section_num = section_match.group(1)
-            section_title = section_match.group(2).strip()
-            section_content = section_match.group(3).strip()
-            
-            # Parse articles within section
-            articles = self._parse_articles(section_content)
-            
-            section = Section(
-                number=section_num,
-                title=section_title,
-                content=section_content,
-                articles=articles
-            )
-            sections.append(section)
-        
-        return sections
+    def _attach_source(self, divisions: List[Division], measurements: List[Measurement], content: str):
+        """Point every node of the tree and every measurement at the text their spans refer to"""
+        parts = list(chain.from_iterable(d.parts for d in divisions))
+        sections = list(chain.from_iterable(p.sections for p in parts))
+        articles = list(chain.from_iterable(s.articles for s in sections))
+        subarticles = list(chain.from_iterable(a.subarticles for a in articles))
+        clauses = list(chain.from_iterable(sa.clauses for sa in subarticles))
+        sub_clauses = list(chain.from_iterable(c.sub_clauses for c in clauses))
+        for node in chain(divisions, parts, sections, articles, subarticles, clauses, sub_clauses, measurements):
+            node.source = content
     
-    def _parse_articles(self, content: str) -> List[Article]:
-        """Parse articles within section content"""
-        articles = []
-        
-        # Pattern to match "X.Y.Z" followed by title and content
-        article_pattern = r'^(\d+\.\d+\.\d+)\s*\.?\s*\n([^\n]+)\s*\n(.*?)(?=^\d+\.\d+\.\d+|\Z)'
-        article_matches = re.finditer(article_pattern, content, re.MULTILINE | re.DOTALL)
-        
-        for article_match in article_matches:
-            article_num = article_match.group(1)
-            article_title = article_match.group(2).strip()
-            article_content = article_match.group(3).strip()
-            
-            # Parse subarticles within article
-            subarticles = self._parse_subarticles(article_content)
-            
-            article = Article(
-                number=article_num,
-                title=article_title,
-                content=article_content,
-                subarticles=subarticles
-            )
-            articles.append(article)
-        
-        return articles
+    def _strip_span(self, content: str, start: int, end: int) -> Tuple[int, int]:
+        """Narrow content[start:end] the way str.strip() would, without copying it"""
+        if start >= end:
+            # A header can run past the stripped end of its parent (trailing blanks on
+            # its title line); its body is empty then
+            return start, start
+        start = self._re_blank.match(content, start, end).end()
+        while end > start and content[end - 1].isspace():
+            end -= 1
+        return start, end
     
-    def _parse_subarticles(self, content: str) -> List[Subarticle]:
-        """Parse subarticles within article content"""
-        subarticles = []
-        
-        # Pattern to match "X.Y.Z.W" followed by title and content
-        subarticle_pattern = r'^(\d+\.\d+\.\d+\.\d+)\s*\.?\s*\n([^\n]+)\s*\n(.*?)(?=^\d+\.\d+\.\d+\.\d+|\Z)'
-        subarticle_matches = re.finditer(subarticle_pattern, content, re.MULTILINE | re.DOTALL)
-        
-        for subarticle_match in subarticle_matches:
-            subarticle_num = subarticle_match.group(1)
-            subarticle_title = subarticle_match.group(2).strip()
-            subarticle_content = subarticle_match.group(3).strip()
-            
-            # Parse clauses within subarticle
-            clauses = self._parse_clauses(subarticle_content)
-            
-            subarticle = Subarticle(
-                number=subarticle_num,
-                title=subarticle_title,
-                content=subarticle_content,
-                clauses=clauses
-            )
-            subarticles.append(subarticle)
-        
-        return subarticles
+    def _tokenize_headers(self, content: str) -> List[Tuple[int, ...]]:
+        """Scan content once for structural headers and clause markers.
+        
+        Returns (level, start, end, number_start, number_end, title_start, title_end)
+        tuples in document order; divisions and clauses have no title and use -1 for its span.
+        """
+        tokens = []
+        levels = self._HEADER_LEVELS
+        header_groups = self._header_groups
+        search = self._re_header.search
+        # Only a title opening like a header or with blanks needs the full _has_title check
+        plain_title = self._PLAIN_TITLE_START
+        match = search(content, 0)
+        while match is not None:
+            kind = match.lastgroup
+            level = levels[kind]
+            number_group, title_group = header_groups[kind]
+            regs = match.regs
+            end = regs[0][1]
+            if title_group < 0:
+                tokens.append((level, regs[0][0], end, regs[number_group][0], regs[number_group][1], -1, -1))
+                if level == _CLAUSE_LEVEL:
+                    match = search(content, end)
+                    continue
+            elif content[regs[title_group][0]] in plain_title or self._has_title(content, match):
+                tokens.append((level, regs[0][0], end, regs[number_group][0], regs[number_group][1],
+                               regs[title_group][0], regs[title_group][1]))
+            else:
+                # Resume at the title line, which may hold a header of its own
+                match = search(content, regs[title_group][0])
+                continue
+            if content[end:end + 1] == '\n' and not content[end + 1:end + 2].isspace():
+                match = search(content, end)
+                continue
+            # Bodies are stripped, so a child header indented on the first body line
+            # still opens the body even though it does not start a line
+            match = None
+            body_start = self._re_blank.match(content, end).end()
+            if body_start < len(content) and content[body_start - 1] != '\n':
+                child = self._re_header_unanchored.match(content, body_start)
+                if child is not None and levels[child.lastgroup] == level + 1:
+                    match = child
+            if match is None:
+                match = search(content, end)
+        return tokens
     
-    def _parse_clauses(self, content: str) -> List[Clause]:
-        """Parse clauses within subarticle content"""
-        clauses = []
-        
-        # Pattern to match numbered clauses like "1)", "2)", "a)", "b)", "i)", "ii)"
-        clause_pattern = r'^(\d+\)|[a-z]\)|[ivx]+\))\s+(.*?)(?=^\d+\)|^[a-z]\)|^[ivx]+\)|\Z)'
-        clause_matches = re.finditer(clause_pattern, content, re.MULTILINE | re.DOTALL)
-        
-        for clause_match in clause_matches:
-            clause_num = clause_match.group(1)
-            clause_content = clause_match.group(2).strip()
-            
-            # Parse sub-clauses within clause
-            sub_clauses = self._parse_sub_clauses(clause_content)
-            
-            clause = Clause(
-                number=clause_num,
-                content=clause_content,
-                sub_clauses=sub_clauses
-            )
-            clauses.append(clause)
-        
-        return clauses
+    def _has_title(self, content: str, match) -> bool:
+        """Check that a part/section/article/subarticle header has a title line of its own.
+        
+        The title must not be blank (only possible at the end of the text) or be a header
+        of an enclosing level, which would end this header's parent before it.
+        """
+        title_group = self._header_groups[match.lastgroup][1]
+        title_start = match.start(title_group)
+        if content[title_start].isspace() and content[title_start:match.end(title_group)].isspace():
+            return False
+        enclosing = self._re_header.match(content, title_start)
+        if enclosing is None:
+            return True
+        enclosing_level = self._HEADER_LEVELS[enclosing.lastgroup]
+        if enclosing_level >= self._HEADER_LEVELS[match.lastgroup]:
+            return True
+        return enclosing_level > 0 and not self._has_title(content, enclosing)
     
-    def _parse_sub_clauses(self, content: str) -> List[Clause]:
-        """Parse sub-clauses within clause content"""
+    def _split_on_token(self, content: str, base: int, tokens: List[Tuple[int, ...]], level: int,
+                        end: int) -> Iterator[Tuple[Tuple[int, ...], int, int, List[Tuple[int, ...]]]]:
+        """Yield each header token of one level with its stripped body span and the tokens inside it.
+        
+        content starts at offset base; spans are absolute and the last body runs to end.
+        Tokens ahead of the first header of this level have no parent and are dropped.
+        """
+        heads = [i for i, token in enumerate(tokens) if token[0] == level]
+        heads.append(len(tokens))
+        for i, next_i in zip(heads, heads[1:]):
+            body_end = tokens[next_i][1] if next_i < len(tokens) else end
+            start, stop = self._strip_span(content, tokens[i][2] - base, body_end - base)
+            yield tokens[i], base + start, base + stop, tokens[i + 1:next_i]
+    
+    def _parse_sub_clauses(self, content: str, base: int = 0) -> List[Clause]:
+        """Parse sub-clauses within clause content that starts at offset base"""
         sub_clauses = []
         
-        # Pattern to match sub-clauses like "a)", "b)", "i)", "ii)"
-        sub_clause_pattern = r'^([a-z]\)|[ivx]+\))\s+(.*?)(?=^[a-z]\)|^[ivx]+\)|\Z)'
-        sub_clause_matches = re.finditer(sub_clause_pattern, content, re.MULTILINE | re.DOTALL)
+        # Match sub-clauses like "a)", "b)", "i)", "ii)"
+        sub_clause_matches = self._re_subclause.finditer(content)
         
         for sub_clause_match in sub_clause_matches:
             sub_clause_num = sub_clause_match.group(1)
-            sub_clause_content = sub_clause_match.group(2).strip()
+            sub_clause_num = self._number_intern.setdefault(sub_clause_num, sub_clause_num)
+            start, end = self._strip_span(content, *sub_clause_match.span(2))
             
-            sub_clause = Clause(
-                number=sub_clause_num,
-                content=sub_clause_content
-            )
-            sub_clauses.append(sub_clause)
+            sub_clauses.append(Clause(sub_clause_num, base + start, base + end))
         
         return sub_clauses
     
@@ -281,97 +428,133 @@ class OntarioBuildingCodeParserfromtext:
         """Extract requirement statements from content"""
         requirements = []
         
-        # Look for requirement patterns
-        req_patterns = [
-            r'shall\s+[^.]*\.',
-            r'must\s+[^.]*\.',
-            r'required\s+[^.]*\.',
-            r'mandatory\s+[^.]*\.',
-            r'conform\s+[^.]*\.',
-            r'comply\s+[^.]*\.'
-        ]
+        content_lower = content.lower()
         
-        for pattern in req_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
+        # Look for requirement patterns
+        for keyword, pattern in self._req_patterns:
+            if keyword not in content_lower:
+                continue
+            matches = pattern.finditer(content)
             for match in matches:
                 requirements.append(match.group().strip())
         
         return requirements
     
-    def _extract_measurements(self, content: str) -> List[Dict[str, Any]]:
-        """Extract measurements from content"""
+    def _extract_measurements(self, content: str, base: int = 0) -> List[Measurement]:
+        """Extract measurements from content that starts at offset base"""
         measurements = []
+        # Group 2 of the measurement pattern is the unit as written
+        unit_map = self._UNIT_MAP
         
-        for pattern in self.measurement_patterns:
-            matches = re.finditer(pattern, content, re.IGNORECASE)
-            for match in matches:
-                value = float(match.group(1))
-                unit = self._extract_unit(match.group(0))
-                context = self._get_context(content, match.start(), match.end())
-                
-                measurements.append({
-                    'value': value,
-                    'unit': unit,
-                    'context': context,
-                    'full_match': match.group(0)
-                })
+        for match in self._re_measurement.finditer(content):
+            value = float(match.group(1))
+            unit = unit_map.get(match.group(2).lower(), 'unknown')
+            context_start, context_end = self._get_context_span(content, match.start(), match.end())
+            
+            # Context text is only sliced out of the source when it is read
+            measurements.append(Measurement(
+                value=value,
+                unit=unit,
+                start=base + match.start(),
+                end=base + match.end(),
+                context_start=base + context_start,
+                context_end=base + context_end
+            ))
         
         return measurements
     
-    def _extract_unit(self, text: str) -> str:
-        """Extract unit from measurement text"""
-        text_lower = text.lower()
-        if 'feet' in text_lower or 'ft' in text_lower:
-            return 'feet'
-        elif 'meter' in text_lower or 'm\b' in text_lower:
-            return 'meters'
-        elif 'inch' in text_lower or 'in\b' in text_lower:
-            return 'inches'
-        elif 'mm' in text_lower:
-            return 'millimeters'
-        elif 'cm' in text_lower:
-            return 'centimeters'
-        elif 'kpa' in text_lower:
-            return 'kilopascals'
-        elif 'mpa' in text_lower:
-            return 'megapascals'
-        elif 'kn' in text_lower:
-            return 'kilonewtons'
-        elif 'kg' in text_lower:
-            return 'kilograms'
-        return 'unknown'
-    
-    def _get_context(self, content: str, start: int, end: int, context_length: int = 100) -> str:
-        """Get context around a match"""
+    def _get_context_span(self, content: str, start: int, end: int, context_length: int = 100) -> Tuple[int, int]:
+        """Get the span of the context around a match"""
         context_start = max(0, start - context_length)
         context_end = min(len(content), end + context_length)
-        return content[context_start:context_end].strip()
+        return context_start, context_end
+    
+    def reset(self):
+        """Drop the parsed structure, keeping the compiled patterns for the next parse"""
+        self.structure = None
     
-    def get_measurements_by_unit(self, unit: str) -> List[Dict[str, Any]]:
+    def get_measurements_by_unit(self, unit: str) -> List[Measurement]:
         """Get all measurements of a specific unit"""
         if not self.structure:
             return []
-        return [m for m in self.structure.measurements if m['unit'] == unit]
+        if self._measurements_by_unit is None:
+            by_unit = {}
+            for measurement in self.structure.measurements:
+                by_unit.setdefault(measurement['unit'], []).append(measurement)
+            self._measurements_by_unit = by_unit
+        return list(self._measurements_by_unit.get(unit, ()))
     
     def get_requirements_by_keyword(self, keyword: str) -> List[str]:
         """Get all requirements containing a specific keyword"""
         if not self.structure:
             return []
-        return [req for req in self.structure.requirements if keyword.lower() in req.lower()]
+        if self._requirements_lower is None:
+            self._requirements_lower = [req.lower() for req in self.structure.requirements]
+        keyword = keyword.lower()
+        return [req for req, req_lower in zip(self.structure.requirements, self._requirements_lower)
+                if keyword in req_lower]
+    
+    def _get_indexes(self) -> Dict[str, Dict[Any, Any]]:
+        """Build number-to-node indexes over the parsed tree on first use"""
+        if self._indexes is None:
+            sections, articles, subarticles, clauses = {}, {}, {}, {}
+            for division in self._structure.divisions:
+                for part in division.parts:
+                    for section in part.sections:
+                        # setdefault keeps the first node when a number repeats
+                        sections.setdefault(section.number, section)
+                        for article in section.articles:
+                            articles.setdefault(article.number, article)
+                            for subarticle in article.subarticles:
+                                subarticles.setdefault(subarticle.number, subarticle)
+                                for clause in subarticle.clauses:
+                                    clauses.setdefault((subarticle.number, clause.number), clause)
+            self._indexes = {
+                'sections': sections,
+                'articles': articles,
+                'subarticles': subarticles,
+                'clauses': clauses,
+            }
+        return self._indexes
     
     def find_section_by_number(self, section_number: str) -> Optional[Section]:
         """Find a section by its number"""
         if not self.structure:
             return None
-        
-        for division in self.structure.divisions:
-            if division.parts:
-                for part in division.parts:
-                    if part.sections:
-                        for section in part.sections:
-                            if section.number == section_number:
-                                return section
-        return None
+        return self._get_indexes()['sections'].get(section_number)
+    
+    def find_article_by_number(self, article_number: str) -> Optional[Article]:
+        """Find an article by its number"""
+        if not self.structure:
+            return None
+        return self._get_indexes()['articles'].get(article_number)
+    
+    def find_subarticle_by_number(self, subarticle_number: str) -> Optional[Subarticle]:
+        """Find a subarticle by its number"""
+        if not self.structure:
+            return None
+        return self._get_indexes()['subarticles'].get(subarticle_number)
+    
+    def find_clause(self, subarticle_number: str, clause_number: str) -> Optional[Clause]:
+        """Find a clause, e.g. ("9.8.2.1", "1)"), by its subarticle and clause numbers"""
+        if not self.structure:
+            return None
+        return self._get_indexes()['clauses'].get((subarticle_number, clause_number))
+    
+    def _level_counts(self) -> Dict[str, int]:
+        """Count the nodes at each level of the parsed hierarchy"""
+        parts = list(chain.from_iterable(d.parts for d in self.structure.divisions))
+        sections = list(chain.from_iterable(p.sections for p in parts))
+        articles = list(chain.from_iterable(s.articles for s in sections))
+        subarticles = list(chain.from_iterable(a.subarticles for a in articles))
+        clauses = sum(len(sa.clauses) for sa in subarticles)
+        return {
+            'parts': len(parts),
+            'sections': len(sections),
+            'articles': len(articles),
+            'subarticles': len(subarticles),
+            'clauses': clauses,
+        }
     
     def export_to_json(self, output_path: str):
         """Export parsed data to JSON"""
@@ -379,25 +562,17 @@ class OntarioBuildingCodeParserfromtext:
             print("No structure to export")
             return
         
-        def serialize_obj(obj):
-            if hasattr(obj, '__dict__'):
-                result = {}
-                for key, value in obj.__dict__.items():
-                    if isinstance(value, list):
-                        result[key] = [serialize_obj(item) for item in value]
-                    elif hasattr(value, '__dict__'):
-                        result[key] = serialize_obj(value)
-                    else:
-                        result[key] = value
-                return result
-            return obj
-        
+        counts = self._level_counts()
         data = {
-            'structure': serialize_obj(self.structure),
+            'structure': {
+                'divisions': [asdict(d, dict_factory=_export_dict) for d in self.structure.divisions],
+                'measurements': [dict(m) for m in self.structure.measurements],
+                'requirements': list(self.structure.requirements)
+            },
             'summary': {
                 'total_divisions': len(self.structure.divisions),
-                'total_parts': sum(len(div.parts) for div in self.structure.divisions if div.parts),
-                'total_sections': sum(len(part.sections) for div in self.structure.divisions if div.parts for part in div.parts if part.sections),
+                'total_parts': counts['parts'],
+                'total_sections': counts['sections'],
                 'total_measurements': len(self.structure.measurements),
                 'total_requirements': len(self.structure.requirements)
             }
@@ -417,33 +592,12 @@ class OntarioBuildingCodeParserfromtext:
         
         print(f"Total divisions: {len(self.structure.divisions)}")
         
-        total_parts = 0
-        total_sections = 0
-        total_articles = 0
-        total_subarticles = 0
-        total_clauses = 0
-        
-        for division in self.structure.divisions:
-            if division.parts:
-                total_parts += len(division.parts)
-                for part in division.parts:
-                    if part.sections:
-                        total_sections += len(part.sections)
-                        for section in part.sections:
-                            if section.articles:
-                                total_articles += len(section.articles)
-                                for article in section.articles:
-                                    if article.subarticles:
-                                        total_subarticles += len(article.subarticles)
-                                        for subarticle in article.subarticles:
-                                            if subarticle.clauses:
-                                                total_clauses += len(subarticle.clauses)
-        
-        print(f"Total parts: {total_parts}")
-        print(f"Total sections: {total_sections}")
-        print(f"Total articles: {total_articles}")
-        print(f"Total subarticles: {total_subarticles}")
-        print(f"Total clauses: {total_clauses}")
+        counts = self._level_counts()
+        print(f"Total parts: {counts['parts']}")
+        print(f"Total sections: {counts['sections']}")
+        print(f"Total articles: {counts['articles']}")
+        print(f"Total subarticles: {counts['subarticles']}")
+        print(f"Total clauses: {counts['clauses']}")
         print(f"Total requirements: {len(self.structure.requirements)}")
         print(f"Total measurements: {len(self.structure.measurements)}")
         
@@ -457,6 +611,83 @@ class OntarioBuildingCodeParserfromtext:
         for unit, count in sorted(unit_counts.items()):
             print(f"  {unit}: {count}")
 
+# Token level of clauses and the node type built for each level
+_CLAUSE_LEVEL = 5
+_NODE_TYPES = (Division, Part, Section, Article, Subarticle, Clause)
+
+def _build_tree(letter: str, tokens: List[Tuple[int, ...]], source: str, base: int,
+                split_sub_clauses, numbers: Dict[str, str]) -> Division:
+    """Assemble one division from its tokens; source is the division text starting at offset base.
+    
+    Open nodes sit on a stack as [level, token, children]. Each token closes the open
+    nodes at its level or deeper and opens a node only when its parent level is open;
+    tokens without a parent (an article before the first section of a part, say) are
+    dropped along with the text around them. A final level 0 token closes everything.
+    Only locals, indexing and append are used in the loop, and nodes are built
+    positionally with their child lists, so PyPy's JIT (or Cython) can compile it as is.
+    """
+    end = base + len(source)
+    parts = []
+    stack = [[0, None, parts]]
+    for token in chain(tokens, ((0, end),)):
+        level = token[0]
+        close = token[1]
+        while stack[-1][0] >= level and len(stack) > 1:
+            node_level, node_token, children = stack.pop()
+            # Strip the body between the header and the closing token
+            start = node_token[2] - base
+            stop = close - base
+            while start < stop and source[start].isspace():
+                start += 1
+            while stop > start and source[stop - 1].isspace():
+                stop -= 1
+            if stop < start:
+                # The header ran past the stripped end of its parent
+                stop = start
+            if node_level == _CLAUSE_LEVEL:
+                # A clause marker needs whitespace after it and something other than
+                # whitespace (its text or the next marker) before the subarticle ends
+                marker_end = node_token[2] - base
+                if marker_end >= close - base or not source[marker_end].isspace():
+                    continue
+                if start == stop and level != _CLAUSE_LEVEL:
+                    continue
+                number = source[node_token[3] - base:node_token[4] - base]
+                number = numbers.setdefault(number, number)
+                sub_clauses = split_sub_clauses(source[start:stop], base + start)
+                stack[-1][2].append(Clause(number, base + start, base + stop, sub_clauses))
+            else:
+                number = source[node_token[3] - base:node_token[4] - base]
+                title = source[node_token[5] - base:node_token[6] - base].strip()
+                stack[-1][2].append(_NODE_TYPES[node_level](number, title, base + start, base + stop, children))
+        if level and stack[-1][0] == level - 1:
+            stack.append([level, token, []])
+    return Division(letter, base, end, parts)
+
+def _export_dict(items: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """asdict() factory that writes node spans out as the text they cover"""
+    fields = dict(items)
+    if 'source' not in fields:
+        return fields
+    result = {}
+    for key, value in items:
+        if key == 'start':
+            result['content'] = fields['source'][fields['start']:fields['end']]
+        elif key not in ('end', 'source'):
+            result[key] = value
+    return result
+
+_worker_parser = None
+
+def _parse_division_worker(
+    division_raw: Tuple[str, str, int, List[Tuple[int, ...]]]
+) -> Tuple[Division, List[Measurement], List[str]]:
+    """Process pool entry point taking the _parse_division arguments as one tuple; each worker process reuses one parser instance"""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = OntarioBuildingCodeParserfromtext()
+    return _worker_parser._parse_division(*division_raw)
+
 if __name__ == "__main__":
     # Example usage
     parser = OntarioBuildingCodeParserfromtext()
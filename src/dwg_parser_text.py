@@ -3,12 +3,66 @@ DWG/DXF File Parser
 Parses AutoCAD DWG/DXF files and extracts relevant information
 """
 
-import ezdxf
-from typing import Dict, List, Any, Optional
-from dataclasses import dataclass
-import math
+import re
+import json
+import logging
+import os
+import multiprocessing
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+from dataclasses import dataclass, field
+from math import sqrt as _sqrt, pi as _pi
+import numpy as np
+try:
+    # Numba compiles the line-length kernel to a tight native loop. Without it
+    # installed the NumPy implementation below is used instead.
+    from numba import njit
+except ImportError:
+    njit = None
+try:
+    # orjson encodes floats and tuples natively; the stdlib encoder is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
-@dataclass
+logger = logging.getLogger("DWGParser")
+
+def _ezdxf():
+    """The ezdxf module, imported on first use so loading this module stays cheap"""
+    module = globals().get('ezdxf')
+    if module is None:
+        import ezdxf as module
+        globals()['ezdxf'] = module
+    return module
+
+def __getattr__(name):
+    # Keeps `dwg_parser_text.ezdxf` available (e.g. as a patch target) before the first parse
+    if name == 'ezdxf':
+        return _ezdxf()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+_NUM_RE = re.compile(r'[\d.]+')
+
+# Drawing unit names indexed by the $INSUNITS header value ('' = not reported)
+_UNIT_NAMES = ('unitless', 'inches', 'feet', '', 'millimeters', 'centimeters', 'meters')
+
+
+def _extract_numbers(text: str) -> List[float]:
+    """Return the numeric runs in a dimension/text string as floats"""
+    if text.isdecimal():
+        # Bare integer labels ("250") are the common case; skip the regex
+        return [float(text)]
+    numbers = []
+    for number in _NUM_RE.findall(text):
+        try:
+            numbers.append(float(number))
+        except ValueError:
+            # Runs such as "." or "1.2.3" are not numbers
+            pass
+    return numbers
+
+@dataclass(slots=True)
 class LayerInfo:
     """Represents a layer in the drawing"""
     name: str
@@ -16,7 +70,7 @@ class LayerInfo:
     is_visible: bool
     line_type: str = "CONTINUOUS"
 
-@dataclass
+@dataclass(slots=True)
 class EntityInfo:
     """Represents an entity in the drawing"""
     entity_type: str
@@ -24,7 +78,7 @@ class EntityInfo:
     handle: str
     data: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
 class DrawingInfo:
     """Represents drawing information"""
     filename: str
@@ -35,10 +89,141 @@ class DrawingInfo:
     dimensions: List[Dict[str, Any]]
     text_entities: List[Dict[str, Any]]
     blocks: List[Dict[str, Any]]
+    # Per-entity columns aligned with ``entities``: 'entity_type' and 'layer'
+    # (object arrays), 'length' and 'radius' (float64, NaN where not applicable)
+    columns: Dict[str, np.ndarray] = field(default_factory=dict)
+
+def _dimension_value(text: str) -> float:
+    """Extract numeric value from dimension text"""
+    try:
+        numbers = _extract_numbers(text)
+        if numbers:
+            return numbers[0]
+    except:
+        pass
+    return 0.0
+
+def _line_data(entity) -> Dict[str, Any]:
+    """Extract LINE entity data (the length is filled in by _set_line_lengths)"""
+    dxf = entity.dxf
+    s, e = dxf.start, dxf.end
+    return {
+        'start': (s.x, s.y, s.z),
+        'end': (e.x, e.y, e.z)
+    }
+
+def _line_lengths_numpy(starts: np.ndarray, ends: np.ndarray) -> np.ndarray:
+    """Euclidean distance between matching rows of two (N, 3) arrays"""
+    return np.linalg.norm(ends - starts, axis=1)
+
+def _line_lengths_loop(starts, ends):
+    """Euclidean distance between matching rows of two (N, 3) arrays"""
+    n = starts.shape[0]
+    lengths = np.empty(n, dtype=np.float64)
+    for i in range(n):
+        dx = ends[i, 0] - starts[i, 0]
+        dy = ends[i, 1] - starts[i, 1]
+        dz = ends[i, 2] - starts[i, 2]
+        lengths[i] = _sqrt(dx * dx + dy * dy + dz * dz)
+    return lengths
+
+_line_lengths = njit(cache=True)(_line_lengths_loop) if njit is not None else _line_lengths_numpy
+
+def _set_line_lengths(line_data: List[Dict[str, Any]], coords: List[float]) -> np.ndarray:
+    """Compute the lengths of all LINE entities in one vectorized call.
+
+    ``coords`` holds the start and end points of the lines back to back, six
+    floats per line, in the same order as ``line_data``.
+    """
+    if not line_data:
+        return np.empty(0, dtype=np.float64)
+    points = np.array(coords, dtype=np.float64).reshape(-1, 2, 3)
+    lengths = _line_lengths(points[:, 0], points[:, 1])
+    for data, length in zip(line_data, lengths.tolist()):
+        data['length'] = length
+    return lengths
+
+def _circle_data(entity) -> Dict[str, Any]:
+    """Extract CIRCLE entity data"""
+    dxf = entity.dxf
+    c = dxf.center
+    radius = dxf.radius
+    return {
+        'center': (c.x, c.y, c.z),
+        'radius': radius,
+        'area': _pi * (radius * radius)
+    }
+
+def _arc_data(entity) -> Dict[str, Any]:
+    """Extract ARC entity data"""
+    dxf = entity.dxf
+    c = dxf.center
+    return {
+        'center': (c.x, c.y, c.z),
+        'radius': dxf.radius,
+        'start_angle': dxf.start_angle,
+        'end_angle': dxf.end_angle
+    }
+
+def _text_data(entity) -> Dict[str, Any]:
+    """Extract TEXT entity data"""
+    dxf = entity.dxf
+    p = dxf.insert
+    return {
+        'text': dxf.text,
+        'height': dxf.height,
+        'position': (p.x, p.y, p.z)
+    }
+
+def _dimension_data(entity) -> Dict[str, Any]:
+    """Extract DIMENSION entity data"""
+    text = entity.dxf.text
+    return {
+        'text': text,
+        'measurement': _dimension_value(text)
+    }
+
+# Per-type entity data extractors, keyed by dxftype()
+_HANDLERS = {
+    'LINE': _line_data,
+    'CIRCLE': _circle_data,
+    'ARC': _arc_data,
+    'TEXT': _text_data,
+    'DIMENSION': _dimension_data,
+}
+
+if orjson is not None:
+    def _encode_json(value) -> str:
+        """Encode a value as indented JSON text"""
+        return orjson.dumps(value, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY).decode()
+else:
+    _encode_json = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+
+def _write_json_array(file, items, encode, chunk_size: int = 1024):
+    """Write an iterable as a JSON array nested one level inside the top object.
+
+    Items are encoded in chunks so only ``chunk_size`` records are held as text
+    at once while the per-call encoder setup is still amortized.
+    """
+    items = iter(items)
+    first = True
+    while True:
+        chunk = list(islice(items, chunk_size))
+        if not chunk:
+            break
+        # encode() gives '[\n  item,\n  item\n]'; keep the items, one level deeper
+        body = encode(chunk)[2:-2].replace('\n', '\n  ')
+        file.write('[\n  ' if first else ',\n  ')
+        file.write(body)
+        first = False
+    file.write('[]' if first else '\n  ]')
 
 class DWGParser:
     """Parser for DWG/DXF files"""
     
+    # Drawings with at least this many text entities scan them in a process pool
+    PARALLEL_THRESHOLD = 200_000
+    
     def __init__(self):
         self.drawing_info = None
         self.measurements = []
@@ -47,25 +232,19 @@ class DWGParser:
         """Parse a DWG/DXF file"""
         try:
             # Load the DXF document
-            doc = ezdxf.readfile(file_path)
+            doc = _ezdxf().readfile(file_path)
             msp = doc.modelspace()
             
             # Extract basic information
-            filename = file_path.split('/')[-1] if '/' in file_path else file_path.split('\\')[-1]
+            filename = os.path.basename(file_path)
             version = doc.dxfversion
             units = self._get_units(doc)
             
             # Extract layers
             layers = self._extract_layers(doc)
             
-            # Extract entities
-            entities = self._extract_entities(msp)
-            
-            # Extract dimensions
-            dimensions = self._extract_dimensions(msp)
-            
-            # Extract text entities
-            text_entities = self._extract_text_entities(msp)
+            # Extract entities, dimensions and text entities in one pass
+            entities, dimensions, text_entities, columns = self._extract_entities(msp)
             
             # Extract blocks
             blocks = self._extract_blocks(doc)
@@ -79,7 +258,8 @@ class DWGParser:
                 entities=entities,
                 dimensions=dimensions,
                 text_entities=text_entities,
-                blocks=blocks
+                blocks=blocks,
+                columns=columns
             )
             
             # Extract measurements
@@ -88,22 +268,16 @@ class DWGParser:
             return self.drawing_info
             
         except Exception as e:
-            print(f"Error parsing DWG file: {e}")
+            logger.warning("Error parsing DWG file: %s", e)
             return None
     
     def _get_units(self, doc) -> str:
         """Get drawing units"""
         try:
             units = doc.header.get('$INSUNITS', 0)
-            unit_map = {
-                0: 'unitless',
-                1: 'inches',
-                2: 'feet',
-                4: 'millimeters',
-                5: 'centimeters',
-                6: 'meters'
-            }
-            return unit_map.get(units, 'unknown')
+            if 0 <= units < len(_UNIT_NAMES) and _UNIT_NAMES[units]:
+                return _UNIT_NAMES[units]
+            return 'unknown'
         except:
             return 'unknown'
     
@@ -120,115 +294,92 @@ class DWGParser:
                 )
                 layers.append(layer_info)
         except Exception as e:
-            print(f"Error extracting layers: {e}")
+            logger.warning("Error extracting layers: %s", e)
         return layers
     
-    def _extract_entities(self, msp) -> List[EntityInfo]:
-        """Extract entity information"""
+    def _extract_entities(self, msp) -> Tuple[List[EntityInfo], List[Dict[str, Any]], List[Dict[str, Any]], Dict[str, np.ndarray]]:
+        """Extract entity, dimension and text information in a single modelspace pass"""
         entities = []
-        try:
-            for entity in msp:
-                entity_info = EntityInfo(
-                    entity_type=entity.dxftype(),
-                    layer=entity.dxf.layer,
-                    handle=entity.dxf.handle,
-                    data=self._extract_entity_data(entity)
-                )
-                entities.append(entity_info)
-        except Exception as e:
-            print(f"Error extracting entities: {e}")
-        return entities
-    
-    def _extract_entity_data(self, entity) -> Dict[str, Any]:
-        """Extract specific data from an entity"""
-        data = {}
-        try:
-            if entity.dxftype() == 'LINE':
-                data = {
-                    'start': (entity.dxf.start.x, entity.dxf.start.y, entity.dxf.start.z),
-                    'end': (entity.dxf.end.x, entity.dxf.end.y, entity.dxf.end.z),
-                    'length': self._calculate_line_length(entity)
-                }
-            elif entity.dxftype() == 'CIRCLE':
-                data = {
-                    'center': (entity.dxf.center.x, entity.dxf.center.y, entity.dxf.center.z),
-                    'radius': entity.dxf.radius,
-                    'area': math.pi * entity.dxf.radius ** 2
-                }
-            elif entity.dxftype() == 'ARC':
-                data = {
-                    'center': (entity.dxf.center.x, entity.dxf.center.y, entity.dxf.center.z),
-                    'radius': entity.dxf.radius,
-                    'start_angle': entity.dxf.start_angle,
-                    'end_angle': entity.dxf.end_angle
-                }
-            elif entity.dxftype() == 'TEXT':
-                data = {
-                    'text': entity.dxf.text,
-                    'height': entity.dxf.height,
-                    'position': (entity.dxf.insert.x, entity.dxf.insert.y, entity.dxf.insert.z)
-                }
-            elif entity.dxftype() == 'DIMENSION':
-                data = {
-                    'text': entity.dxf.text,
-                    'measurement': self._extract_dimension_value(entity)
-                }
-        except Exception as e:
-            print(f"Error extracting entity data: {e}")
-        return data
-    
-    def _calculate_line_length(self, line_entity) -> float:
-        """Calculate line length"""
-        try:
-            start = line_entity.dxf.start
-            end = line_entity.dxf.end
-            return math.sqrt((end.x - start.x)**2 + (end.y - start.y)**2 + (end.z - start.z)**2)
-        except:
-            return 0.0
-    
-    def _extract_dimensions(self, msp) -> List[Dict[str, Any]]:
-        """Extract dimension information"""
+        entity_types = []
+        layers = []
+        radii = []
         dimensions = []
-        try:
-            for entity in msp.query('DIMENSION'):
-                dim_data = {
-                    'text': entity.dxf.text,
-                    'layer': entity.dxf.layer,
-                    'measurement': self._extract_dimension_value(entity)
-                }
-                dimensions.append(dim_data)
-        except Exception as e:
-            print(f"Error extracting dimensions: {e}")
-        return dimensions
-    
-    def _extract_dimension_value(self, dim_entity) -> float:
-        """Extract numeric value from dimension"""
-        try:
-            text = dim_entity.dfx.text
-            # Try to extract numeric value from dimension text
-            import re
-            numbers = re.findall(r'[\d.]+', text)
-            if numbers:
-                return float(numbers[0])
-        except:
-            pass
-        return 0.0
-    
-    def _extract_text_entities(self, msp) -> List[Dict[str, Any]]:
-        """Extract text entity information"""
         text_entities = []
+        line_data = []
+        line_index = []
+        # Flat x, y, z buffer of line start/end points, converted to an array once
+        line_coords = []
+        # Walk modelspace directly rather than through msp.query('LINE CIRCLE ...'):
+        # every entity type belongs in `entities`, and query() would itself walk
+        # all of modelspace to build its filtered list.
+        for entity in msp:
+            # A malformed entity is skipped on its own instead of ending the pass
+            try:
+                entity_type = entity.dxftype()
+                dxf = entity.dxf
+                layer = dxf.layer
+                handle = dxf.handle
+            except Exception as e:
+                logger.warning("Error extracting entities: %s", e)
+                continue
+            radius = np.nan
+            data = self._extract_entity_data(entity, entity_type)
+            if data:
+                # The dimension and text records reuse the values already
+                # read by the handlers instead of going back to ezdxf
+                if entity_type == 'DIMENSION':
+                    dimensions.append({
+                        'text': data['text'],
+                        'layer': layer,
+                        'measurement': data['measurement']
+                    })
+                elif entity_type == 'TEXT':
+                    text_entities.append({
+                        'text': data['text'],
+                        'height': data['height'],
+                        'layer': layer,
+                        'position': data['position']
+                    })
+                elif entity_type == 'LINE':
+                    line_data.append(data)
+                    line_index.append(len(entities))
+                    line_coords += data['start']
+                    line_coords += data['end']
+                elif entity_type == 'CIRCLE' or entity_type == 'ARC':
+                    radius = data['radius']
+            entity_info = EntityInfo(
+                entity_type=entity_type,
+                layer=layer,
+                handle=handle,
+                data=data
+            )
+            entities.append(entity_info)
+            entity_types.append(entity_type)
+            layers.append(layer)
+            radii.append(radius)
+
+        lengths = np.full(len(entities), np.nan)
+        lengths[line_index] = _set_line_lengths(line_data, line_coords)
+        columns = {
+            'entity_type': np.array(entity_types, dtype=object),
+            'layer': np.array(layers, dtype=object),
+            'length': lengths,
+            'radius': np.array(radii, dtype=np.float64),
+        }
+        return entities, dimensions, text_entities, columns
+    
+    def _extract_entity_data(self, entity, entity_type: Optional[str] = None) -> Dict[str, Any]:
+        """Extract specific data from an entity"""
+        if entity_type is None:
+            entity_type = entity.dxftype()
+        handler = _HANDLERS.get(entity_type)
+        if handler is None:
+            return {}
         try:
-            for entity in msp.query('TEXT'):
-                text_data = {
-                    'text': entity.dxf.text,
-                    'height': entity.dxf.height,
-                    'layer': entity.dxf.layer,
-                    'position': (entity.dxf.insert.x, entity.dxf.insert.y, entity.dxf.insert.z)
-                }
-                text_entities.append(text_data)
+            return handler(entity)
         except Exception as e:
-            print(f"Error extracting text entities: {e}")
-        return text_entities
+            logger.warning("Error extracting entity data: %s", e)
+            return {}
     
     def _extract_blocks(self, doc) -> List[Dict[str, Any]]:
         """Extract block information"""
@@ -242,7 +393,7 @@ class DWGParser:
                     }
                     blocks.append(block_data)
         except Exception as e:
-            print(f"Error extracting blocks: {e}")
+            logger.warning("Error extracting blocks: %s", e)
         return blocks
     
     def _extract_measurements(self) -> List[Dict[str, Any]]:
@@ -252,54 +403,90 @@ class DWGParser:
         if not self.drawing_info:
             return measurements
         
+        append = measurements.append
         try:
             # Extract measurements from dimensions
             for dim in self.drawing_info.dimensions:
-                if dim['measurement'] > 0:
-                    measurements.append({
+                value = dim['measurement']
+                if value > 0:
+                    append({
                         'type': 'dimension',
-                        'value': dim['measurement'],
+                        'value': value,
                         'layer': dim['layer'],
                         'text': dim['text']
                     })
             
-            # Extract measurements from line lengths
-            for entity in self.drawing_info.entities:
-                if entity.entity_type == 'LINE' and 'length' in entity.data:
-                    measurements.append({
-                        'type': 'line_length',
-                        'value': entity.data['length'],
-                        'layer': entity.layer
-                    })
-                elif entity.entity_type == 'CIRCLE' and 'radius' in entity.data:
-                    measurements.append({
-                        'type': 'radius',
-                        'value': entity.data['radius'],
-                        'layer': entity.layer
+            # Extract measurements from line lengths and circle radii
+            columns = self.drawing_info.columns
+            if columns:
+                types = columns['entity_type']
+                is_line = (types == 'LINE') & ~np.isnan(columns['length'])
+                is_circle = (types == 'CIRCLE') & ~np.isnan(columns['radius'])
+                indices = np.flatnonzero(is_line | is_circle)
+                # Pull the selected rows out as Python lists once; indexing numpy
+                # arrays element by element is slower than list indexing
+                line_flags = is_line[indices].tolist()
+                values = np.where(is_line, columns['length'], columns['radius'])[indices].tolist()
+                layers = columns['layer'][indices].tolist()
+                for is_line_row, value, layer in zip(line_flags, values, layers):
+                    append({
+                        'type': 'line_length' if is_line_row else 'radius',
+                        'value': value,
+                        'layer': layer
                     })
-            
-            # Extract measurements from text entities
-            for text in self.drawing_info.text_entities:
-                import re
-                numbers = re.findall(r'[\d.]+', text['text'])
-                for number in numbers:
-                    try:
-                        value = float(number)
-                        if value > 0:
-                            measurements.append({
-                                'type': 'text_measurement',
+            else:
+                for entity in self.drawing_info.entities:
+                    entity_type = entity.entity_type
+                    if entity_type == 'LINE':
+                        value = entity.data.get('length')
+                        if value is not None:
+                            append({
+                                'type': 'line_length',
+                                'value': value,
+                                'layer': entity.layer
+                            })
+                    elif entity_type == 'CIRCLE':
+                        value = entity.data.get('radius')
+                        if value is not None:
+                            append({
+                                'type': 'radius',
                                 'value': value,
-                                'layer': text['layer'],
-                                'text': text['text']
+                                'layer': entity.layer
                             })
-                    except:
-                        pass
+            
+            # Extract measurements from text entities. The strings are plain data,
+            # so drawings with very many of them scan in a process pool.
+            text_entities = self.drawing_info.text_entities
+            texts = [text['text'] for text in text_entities]
+            workers = os.cpu_count() or 1
+            if workers > 1 and len(texts) >= self.PARALLEL_THRESHOLD:
+                chunksize = max(1, len(texts) // (workers * 4))
+                # Spawned, not forked: the GUI calls this from a worker thread
+                with ProcessPoolExecutor(max_workers=workers,
+                                         mp_context=multiprocessing.get_context('spawn')) as executor:
+                    numbers = list(executor.map(_extract_numbers, texts, chunksize=chunksize))
+            else:
+                numbers = map(_extract_numbers, texts)
+            for text, values in zip(text_entities, numbers):
+                for value in values:
+                    if value > 0:
+                        append({
+                            'type': 'text_measurement',
+                            'value': value,
+                            'layer': text['layer'],
+                            'text': text['text']
+                        })
                         
         except Exception as e:
-            print(f"Error extracting measurements: {e}")
+            logger.warning("Error extracting measurements: %s", e)
         
         return measurements
     
+    def reset(self):
+        """Drop the parsed drawing and its measurements"""
+        self.drawing_info = None
+        self.measurements = []
+    
     def get_measurements(self) -> List[Dict[str, Any]]:
         """Get all measurements from the drawing."""
         return self.measurements if self.measurements is not None else []
@@ -310,38 +497,46 @@ class DWGParser:
             print("No drawing data to export")
             return
         
-        import json
-        
-        data = {
-            'filename': self.drawing_info.filename,
-            'version': self.drawing_info.version,
-            'units': self.drawing_info.units,
-            'layers': [
-                {
-                    'name': layer.name,
-                    'color': layer.color,
-                    'is_visible': layer.is_visible,
-                    'line_type': layer.line_type
-                }
-                for layer in self.drawing_info.layers
-            ],
-            'entities': [
-                {
-                    'entity_type': entity.entity_type,
-                    'layer': entity.layer,
-                    'handle': entity.handle,
-                    'data': entity.data
-                }
-                for entity in self.drawing_info.entities
-            ],
-            'dimensions': self.drawing_info.dimensions,
-            'text_entities': self.drawing_info.text_entities,
-            'blocks': self.drawing_info.blocks,
-            'measurements': self.measurements
-        }
+        info = self.drawing_info
+        layers = (
+            {
+                'name': layer.name,
+                'color': layer.color,
+                'is_visible': layer.is_visible,
+                'line_type': layer.line_type
+            }
+            for layer in info.layers
+        )
+        entities = (
+            {
+                'entity_type': entity.entity_type,
+                'layer': entity.layer,
+                'handle': entity.handle,
+                'data': entity.data
+            }
+            for entity in info.entities
+        )
         
+        # Stream the document one record at a time rather than building the
+        # whole dict first; the output matches json.dump(..., indent=2).
+        encode = _encode_json
         with open(output_path, 'w', encoding='utf-8') as file:
-            json.dump(data, file, indent=2, ensure_ascii=False)
+            file.write('{\n')
+            for key in ('filename', 'version', 'units'):
+                file.write(f'  "{key}": {encode(getattr(info, key))},\n')
+            for key, items in (
+                ('layers', layers),
+                ('entities', entities),
+                ('dimensions', info.dimensions),
+                ('text_entities', info.text_entities),
+                ('blocks', info.blocks),
+            ):
+                file.write(f'  "{key}": ')
+                _write_json_array(file, items, encode)
+                file.write(',\n')
+            file.write('  "measurements": ')
+            _write_json_array(file, self.measurements, encode)
+            file.write('\n}')
     
     def print_summary(self):
         """Print a summary of the drawing"""
@@ -427,6 +622,12 @@ class DWGParser:
     def get_blocks(self) -> List[Dict[str, Any]]:
         """Return the list of blocks in the drawing."""
         return self._get_info_list('blocks')
+
+    def get_columns(self) -> Dict[str, np.ndarray]:
+        """Return the per-entity columns (entity_type, layer, length, radius)."""
+        if self.drawing_info and self.drawing_info.columns:
+            return self.drawing_info.columns
+        return {}
 if __name__ == "__main__":
     import sys
     parser = DWGParser()
@@ -8,6 +8,26 @@ from dataclasses import dataclass
 import logging
 import json
 import os
+import re
+import sys
+import math
+from collections import Counter
+from operator import attrgetter
+from concurrent.futures import ThreadPoolExecutor
+import multiprocessing
+
+import numpy as np
+try:
+    # Numba compiles the code-measurement reduction to native code. Without it
+    # installed a vectorized NumPy version is used instead.
+    from numba import njit
+except ImportError:
+    njit = None
+try:
+    # orjson writes the results file natively; the stdlib encoder is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
 from .dwg_parser_text import DWGParser, DrawingInfo, LayerInfo, EntityInfo
 from .building_code_parser_text import OntarioBuildingCodeParserfromtext
@@ -16,10 +36,64 @@ from .building_code_parser_text import OntarioBuildingCodeParserfromtext
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("DWGValidator")
 
+# A digit (including the superscript/subscript forms used for areas and
+# volumes) and a unit marker anywhere in the same text, in either order.
+# 'm' also covers 'mm'. Case-insensitive so texts need no lowercased copy.
+_DIGIT = r'[\d\u00b2\u00b3\u00b9\u2070\u2074-\u2079\u2080-\u2089]'
+_UNIT = r'(?:ft|in|m|"|\')'
+_DIGIT_UNIT_RE = re.compile(rf'{_DIGIT}.*?{_UNIT}|{_UNIT}.*?{_DIGIT}', re.DOTALL | re.IGNORECASE)
+
+# Discipline prefixes of standard (AIA/NCS style) layer names
+_STANDARD_PREFIXES = ('A-', 'S-', 'E-', 'P-', 'F-', 'C-', 'D-', 'T-')
+
+# Result statuses and check names, interned so the summary's dict lookups
+# and comparisons hit the identity fast path
+PASS = sys.intern('PASS')
+WARNING = sys.intern('WARNING')
+FAIL = sys.intern('FAIL')
+
+CHECK_FILE_PARSING = sys.intern('File Parsing')
+CHECK_EXCEPTION = sys.intern('Validation Exception')
+CHECK_UNITS = sys.intern('Drawing Units')
+CHECK_LAYERS = sys.intern('Layer Standards')
+CHECK_DIMENSIONS = sys.intern('Dimension Completeness')
+CHECK_TEXT = sys.intern('Text Readability')
+CHECK_SCALE = sys.intern('Scale Consistency')
+CHECK_ENTITIES = sys.intern('Entity Organization')
+CHECK_CODE_COMPLIANCE = sys.intern('Building Code Compliance')
+
+_VALID_UNITS = frozenset({'feet', 'inches', 'meters', 'millimeters'})
+
+_STATUS_SYMBOLS = {PASS: '✓', WARNING: '⚠', FAIL: '✗'}
+
+def _convert_and_stats_py(values, units, factors):
+    """Scale each value by factors[units[i]] and return the (min, max) of the results"""
+    lo = math.inf
+    hi = -math.inf
+    for i in range(values.shape[0]):
+        v = values[i] * factors[units[i]]
+        if v < lo:
+            lo = v
+        if v > hi:
+            hi = v
+    return lo, hi
+
+def _convert_and_stats_numpy(values, units, factors):
+    """Scale each value by factors[units[i]] and return the (min, max) of the results"""
+    converted = values * factors[units]
+    return converted.min(), converted.max()
+
+# The plain Python loop stays reachable as _convert_and_stats_py so it can be
+# checked against the NumPy version where numba is not installed
+if njit is not None:
+    _convert_and_stats = njit(cache=True)(_convert_and_stats_py)
+else:
+    _convert_and_stats = _convert_and_stats_numpy
+
 print("DWGParser import successful:", DWGParser)
 print("OntarioBuildingCodeParserfromtext import successful:", OntarioBuildingCodeParserfromtext)
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ValidationResult:
     """Represents a validation result"""
     check_name: str
@@ -32,6 +106,9 @@ class DWGValidator:
     Validator for DWG files against building codes.
     Accepts custom parsers for testability.
     """
+    # Drawings with at least this many entities run their checks in a thread pool
+    PARALLEL_THRESHOLD = 50_000
+
     def __init__(
         self,
         dwg_parser: Optional[DWGParser] = None,
@@ -49,6 +126,10 @@ class DWGValidator:
             'centimeters': 0.393701,
             'meters': 39.3701
         }
+        # (measurements, their count, unit names, values, unit codes) of the last encoded code corpus
+        self._code_arrays = None
+        # Parser measurements for the drawing being validated, shared by the checks
+        self._cached_measurements = None
 
     def validate_file(
         self,
@@ -63,8 +144,8 @@ class DWGValidator:
         if drawing_info is None:
             if not dwg_file_path:
                 self.validation_results.append(ValidationResult(
-                    check_name="File Parsing",
-                    status="FAIL",
+                    check_name=CHECK_FILE_PARSING,
+                    status=FAIL,
                     message="No file path or DrawingInfo provided",
                     details={}
                 ))
@@ -73,98 +154,118 @@ class DWGValidator:
 
         if not drawing_info:
             self.validation_results.append(ValidationResult(
-                check_name="File Parsing",
-                status="FAIL",
+                check_name=CHECK_FILE_PARSING,
+                status=FAIL,
                 message="Could not parse DWG file",
                 details={}
             ))
             return self.validation_results
 
+        checks = [
+            self._check_drawing_units,
+            self._check_layer_standards,
+            self._check_dimension_completeness,
+            self._check_text_readability,
+            self._check_scale_consistency,
+            self._check_entity_organization,
+        ]
+        if self.building_code_parser:
+            checks.append(self._check_against_building_codes)
+
+        # The checks only read drawing_info, so large drawings run them side by
+        # side; results are collected in check order either way
+        self._cached_measurements = None
         try:
-            self._check_drawing_units(drawing_info)
-            self._check_layer_standards(drawing_info)
-            self._check_dimension_completeness(drawing_info)
-            self._check_text_readability(drawing_info)
-            self._check_scale_consistency(drawing_info)
-            self._check_entity_organization(drawing_info)
-            if self.building_code_parser:
-                self._check_against_building_codes(drawing_info)
+            if len(drawing_info.entities) >= self.PARALLEL_THRESHOLD:
+                with ThreadPoolExecutor(max_workers=min(8, len(checks))) as executor:
+                    futures = [executor.submit(check, drawing_info) for check in checks]
+                outcomes = [self._run_check(future.result) for future in futures]
+            else:
+                outcomes = [self._run_check(check, drawing_info) for check in checks]
+        finally:
+            self._cached_measurements = None
+        self.validation_results.extend(outcomes)
+
+        return self.validation_results
+
+    def _get_measurements(self) -> List[Dict[str, Any]]:
+        """Parser measurements, fetched once per validate_file call"""
+        if self._cached_measurements is None:
+            self._cached_measurements = self.dwg_parser.get_measurements()
+        return self._cached_measurements
+
+    def _run_check(self, check, *args) -> ValidationResult:
+        """Run one check, turning an exception into a FAIL result so the others still report"""
+        try:
+            return check(*args)
         except Exception as e:
             logger.exception("Validation failed with exception")
-            self.validation_results.append(ValidationResult(
-                check_name="Validation Exception",
-                status="FAIL",
+            return ValidationResult(
+                check_name=CHECK_EXCEPTION,
+                status=FAIL,
                 message=f"Exception during validation: {e}",
                 details={"exception": str(e)}
-            ))
-
-        return self.validation_results
+            )
 
-    def _check_drawing_units(self, drawing_info: DrawingInfo):
+    def _check_drawing_units(self, drawing_info: DrawingInfo) -> ValidationResult:
         units = drawing_info.units.lower()
-        if units in ['feet', 'inches', 'meters', 'millimeters']:
-            status = "PASS"
+        if units in _VALID_UNITS:
+            status = PASS
             message = f"Drawing units ({units}) are appropriate for building drawings"
         else:
-            status = "WARNING"
+            status = WARNING
             message = f"Drawing units ({units}) may not be standard for building drawings"
-        self.validation_results.append(ValidationResult(
-            check_name="Drawing Units",
+        return ValidationResult(
+            check_name=CHECK_UNITS,
             status=status,
             message=message,
             details={'units': units}
-        ))
-
-    def _check_layer_standards(self, drawing_info: DrawingInfo):
-        layer_names = [layer.name for layer in drawing_info.layers]
-        standard_prefixes = ['A-', 'S-', 'E-', 'P-', 'F-', 'C-', 'D-', 'T-']
-        has_standard_layers = any(
-            any(layer.startswith(prefix) for prefix in standard_prefixes)
-            for layer in layer_names
         )
-        layer_count = len(layer_names)
+
+    def _check_layer_standards(self, drawing_info: DrawingInfo) -> ValidationResult:
+        layers = drawing_info.layers
+        has_standard_layers = any(layer.name.startswith(_STANDARD_PREFIXES) for layer in layers)
+        layer_count = len(layers)
         if has_standard_layers and layer_count > 5:
-            status = "PASS"
+            status = PASS
             message = "Layer organization follows common standards"
         elif layer_count > 5:
-            status = "WARNING"
+            status = WARNING
             message = "Layers present but may not follow standard naming conventions"
         else:
-            status = "WARNING"
+            status = WARNING
             message = "Limited layer organization detected"
-        self.validation_results.append(ValidationResult(
-            check_name="Layer Standards",
+        return ValidationResult(
+            check_name=CHECK_LAYERS,
             status=status,
             message=message,
             details={
                 'layer_count': layer_count,
                 'has_standard_layers': has_standard_layers,
-                'layer_names': layer_names[:10]
+                'layer_names': [layer.name for layer in layers[:10]]
             }
-        ))
+        )
 
-    def _check_dimension_completeness(self, drawing_info: DrawingInfo):
+    def _check_dimension_completeness(self, drawing_info: DrawingInfo) -> ValidationResult:
         dimensions = drawing_info.dimensions
         text_entities = drawing_info.text_entities
         dim_count = len(dimensions)
         text_count = len(text_entities)
-        measurement_texts = []
-        for text in text_entities:
-            text_content = text['text'].lower()
-            if any(char.isdigit() for char in text_content) and any(unit in text_content for unit in ['ft', 'in', 'm', 'mm', '"', "'"]):
-                measurement_texts.append(text['text'])
+        search = _DIGIT_UNIT_RE.search
+        texts = [text['text'] for text in text_entities]
+        measurement_texts = [text for text in texts if search(text)]
         total_measurements = dim_count + len(measurement_texts)
         if total_measurements >= 10:
-            status = "PASS"
+            status = PASS
             message = f"Drawing has adequate dimensions ({total_measurements} total)"
         elif total_measurements >= 5:
-            status = "WARNING"
+            status = WARNING
             message = f"Drawing has some dimensions but may need more ({total_measurements} total)"
         else:
-            status = "FAIL"
+            status = FAIL
             message = f"Drawing appears to lack sufficient dimensions ({total_measurements} total)"
-        self.validation_results.append(ValidationResult(
-            check_name="Dimension Completeness",
+        return ValidationResult(
+            check_name=CHECK_DIMENSIONS,
             status=status,
             message=message,
             details={
@@ -173,108 +274,121 @@ class DWGValidator:
                 'measurement_texts': measurement_texts[:5],
                 'total_measurements': total_measurements
             }
-        ))
+        )
 
-    def _check_text_readability(self, drawing_info: DrawingInfo):
+    def _check_text_readability(self, drawing_info: DrawingInfo) -> ValidationResult:
         text_entities = drawing_info.text_entities
         if not text_entities:
-            self.validation_results.append(ValidationResult(
-                check_name="Text Readability",
-                status="WARNING",
+            return ValidationResult(
+                check_name=CHECK_TEXT,
+                status=WARNING,
                 message="No text entities found in drawing",
                 details={}
-            ))
-            return
-        heights = [text['height'] for text in text_entities if text.get('height', 0) > 0]
-        if not heights:
-            status = "WARNING"
+            )
+        # Unboxed float64 buffer so min/max/mean are single array reductions
+        heights = np.fromiter(
+            (text.get('height', 0) for text in text_entities),
+            dtype=np.float64,
+            count=len(text_entities)
+        )
+        heights = heights[heights > 0]
+        count = heights.size
+        if count:
+            min_height = float(heights.min())
+            max_height = float(heights.max())
+            avg_height = float(heights.mean())
+        else:
+            min_height = max_height = avg_height = 0
+        head = heights[:10].tolist()
+        if not count:
+            status = WARNING
             message = "Text height information not available"
+        elif min_height >= 0.1:
+            status = PASS
+            message = f"Text appears to be readable (min height: {min_height:.3f})"
         else:
-            min_height = min(heights)
-            max_height = max(heights)
-            avg_height = sum(heights) / len(heights)
-            if min_height >= 0.1:
-                status = "PASS"
-                message = f"Text appears to be readable (min height: {min_height:.3f})"
-            else:
-                status = "WARNING"
-                message = f"Some text may be too small (min height: {min_height:.3f})"
-        self.validation_results.append(ValidationResult(
-            check_name="Text Readability",
+            status = WARNING
+            message = f"Some text may be too small (min height: {min_height:.3f})"
+        return ValidationResult(
+            check_name=CHECK_TEXT,
             status=status,
             message=message,
             details={
                 'text_count': len(text_entities),
-                'heights': heights[:10],
-                'min_height': min(heights) if heights else 0,
-                'max_height': max(heights) if heights else 0,
-                'avg_height': sum(heights) / len(heights) if heights else 0
+                'heights': head,
+                'min_height': min_height,
+                'max_height': max_height,
+                'avg_height': avg_height
             }
-        ))
+        )
 
-    def _check_scale_consistency(self, drawing_info: DrawingInfo):
-        measurements = self.dwg_parser.get_measurements()
+    def _check_scale_consistency(self, drawing_info: DrawingInfo) -> ValidationResult:
+        measurements = self._get_measurements()
         if len(measurements) < 2:
-            self.validation_results.append(ValidationResult(
-                check_name="Scale Consistency",
-                status="WARNING",
+            return ValidationResult(
+                check_name=CHECK_SCALE,
+                status=WARNING,
                 message="Insufficient measurements to check scale consistency",
                 details={'measurement_count': len(measurements)}
-            ))
-            return
-        values = [
-            m['value'] for m in measurements
-            if isinstance(m['value'], (int, float)) and m['value'] > 0
-        ]
-        if len(values) < 2:
-            status = "WARNING"
+            )
+        # Count and track min/max in one pass; no list or sort needed
+        value_count = 0
+        min_value = max_value = 0
+        for m in measurements:
+            value = m['value']
+            if isinstance(value, (int, float)) and value > 0:
+                if value_count == 0:
+                    min_value = max_value = value
+                elif value < min_value:
+                    min_value = value
+                elif value > max_value:
+                    max_value = value
+                value_count += 1
+        if value_count < 2:
+            status = WARNING
             message = "Insufficient numeric measurements for scale check"
             ratio = 0
         else:
-            values.sort()
-            ratio = values[-1] / values[0] if values[0] > 0 else float('inf')
+            ratio = max_value / min_value
             if ratio < 1000:
-                status = "PASS"
+                status = PASS
                 message = f"Scale appears consistent (ratio: {ratio:.1f})"
             else:
-                status = "WARNING"
+                status = WARNING
                 message = f"Scale may be inconsistent (ratio: {ratio:.1f})"
-        self.validation_results.append(ValidationResult(
-            check_name="Scale Consistency",
+        return ValidationResult(
+            check_name=CHECK_SCALE,
             status=status,
             message=message,
             details={
                 'measurement_count': len(measurements),
-                'value_count': len(values),
-                'min_value': min(values) if values else 0,
-                'max_value': max(values) if values else 0,
+                'value_count': value_count,
+                'min_value': min_value,
+                'max_value': max_value,
                 'ratio': ratio
             }
-        ))
+        )
 
-    def _check_entity_organization(self, drawing_info: DrawingInfo):
+    def _check_entity_organization(self, drawing_info: DrawingInfo) -> ValidationResult:
         entities = drawing_info.entities
-        entity_types = {}
-        for entity in entities:
-            entity_type = getattr(entity, 'entity_type', None)
-            if entity_type:
-                entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
+        # Plain dict copy so the details hold only JSON-native types
+        entity_types = dict(Counter(filter(None, map(attrgetter('entity_type'), entities))))
         total_entities = len(entities)
         unique_types = len(entity_types)
         if total_entities == 0:
-            status = "WARNING"
+            status = WARNING
             message = "No entities found in drawing"
         elif unique_types >= 3:
-            status = "PASS"
+            status = PASS
             message = f"Good entity organization ({unique_types} types, {total_entities} total)"
         elif unique_types >= 2:
-            status = "WARNING"
+            status = WARNING
             message = f"Limited entity variety ({unique_types} types, {total_entities} total)"
         else:
-            status = "WARNING"
+            status = WARNING
             message = f"Very limited entity types ({unique_types} types, {total_entities} total)"
-        self.validation_results.append(ValidationResult(
-            check_name="Entity Organization",
+        return ValidationResult(
+            check_name=CHECK_ENTITIES,
             status=status,
             message=message,
             details={
@@ -282,47 +396,40 @@ class DWGValidator:
                 'unique_types': unique_types,
                 'entity_types': entity_types
             }
-        ))
+        )
 
-    def _check_against_building_codes(self, drawing_info: DrawingInfo):
+    def _check_against_building_codes(self, drawing_info: DrawingInfo) -> ValidationResult:
         if not self.building_code_parser or not getattr(self.building_code_parser, "structure", None):
-            self.validation_results.append(ValidationResult(
-                check_name="Building Code Compliance",
-                status="WARNING",
+            return ValidationResult(
+                check_name=CHECK_CODE_COMPLIANCE,
+                status=WARNING,
                 message="No building code structure available for comparison",
                 details={}
-            ))
-            return
+            )
         code_measurements = self.building_code_parser.structure.measurements
-        drawing_measurements = self.dwg_parser.get_measurements()
+        drawing_measurements = self._get_measurements()
         if not code_measurements:
-            self.validation_results.append(ValidationResult(
-                check_name="Building Code Compliance",
-                status="WARNING",
+            return ValidationResult(
+                check_name=CHECK_CODE_COMPLIANCE,
+                status=WARNING,
                 message="No building code measurements available for comparison",
                 details={}
-            ))
-            return
-        code_values = []
-        for measurement in code_measurements:
-            value = measurement['value']
-            unit = measurement['unit']
-            inches = value * self.unit_conversion.get(unit, 1.0)
-            code_values.append(inches)
+            )
+        values, units = self._encode_code_measurements(code_measurements)
+        factors = np.array(list(self.unit_conversion.values()) + [1.0], dtype=np.float64)
+        code_min, code_max = _convert_and_stats(values, units, factors)
+        code_min, code_max = float(code_min), float(code_max)
         drawing_values = [
             m['value'] for m in drawing_measurements
             if isinstance(m['value'], (int, float))
         ]
         if not drawing_values:
-            self.validation_results.append(ValidationResult(
-                check_name="Building Code Compliance",
-                status="WARNING",
+            return ValidationResult(
+                check_name=CHECK_CODE_COMPLIANCE,
+                status=WARNING,
                 message="No measurable values found in drawing",
                 details={}
-            ))
-            return
-        code_min = min(code_values) if code_values else 0
-        code_max = max(code_values) if code_values else 0
+            )
         drawing_min = min(drawing_values)
         drawing_max = max(drawing_values)
         # Tolerance-based check
@@ -330,52 +437,77 @@ class DWGValidator:
             ratio_min = drawing_min / code_min
             ratio_max = drawing_max / code_max if code_max > 0 else 1
             if (1 - self.tolerance) <= ratio_min <= (1 + self.tolerance) and (1 - self.tolerance) <= ratio_max <= (1 + self.tolerance):
-                status = "PASS"
+                status = PASS
                 message = "Drawing measurements appear consistent with building codes"
             else:
-                status = "WARNING"
+                status = WARNING
                 message = "Drawing measurements may not align with building code requirements"
         else:
-            status = "WARNING"
+            status = WARNING
             message = "Unable to compare measurements with building codes"
-        self.validation_results.append(ValidationResult(
-            check_name="Building Code Compliance",
+        return ValidationResult(
+            check_name=CHECK_CODE_COMPLIANCE,
             status=status,
             message=message,
             details={
-                'code_measurements': len(code_values),
+                'code_measurements': len(values),
                 'drawing_measurements': len(drawing_values),
                 'code_range': (code_min, code_max),
                 'drawing_range': (drawing_min, drawing_max)
             }
-        ))
+        )
+
+    def _encode_code_measurements(self, code_measurements) -> tuple:
+        """
+        Return the code measurement values and unit codes as arrays. A unit code
+        indexes self.unit_conversion in order; unknown units get the code one past
+        the end. The arrays are reused while the same measurement list, at the same
+        length, is encoded with the same units; a list edited in place at the same
+        length needs reset().
+        """
+        unit_names = tuple(self.unit_conversion)
+        cached = self._code_arrays
+        if (cached is not None and cached[0] is code_measurements
+                and cached[1] == len(code_measurements) and cached[2] == unit_names):
+            return cached[3], cached[4]
+        unit_index = {unit: i for i, unit in enumerate(unit_names)}
+        unknown = len(unit_names)
+        values = np.array([m['value'] for m in code_measurements], dtype=np.float64)
+        units = np.array([unit_index.get(m['unit'], unknown) for m in code_measurements], dtype=np.intp)
+        self._code_arrays = (code_measurements, len(code_measurements), unit_names, values, units)
+        return values, units
+
+    def reset(self):
+        """Drop the results and cached arrays of previous validations"""
+        self.validation_results = []
+        self._code_arrays = None
+        self._cached_measurements = None
 
     def get_summary(self) -> Dict[str, Any]:
         if not self.validation_results:
             return {'status': 'No validation performed', 'results': []}
-        pass_count = sum(1 for result in self.validation_results if result.status == 'PASS')
-        warning_count = sum(1 for result in self.validation_results if result.status == 'WARNING')
-        fail_count = sum(1 for result in self.validation_results if result.status == 'FAIL')
-        overall_status = 'PASS'
+        # Count statuses and serialize the results in the same pass
+        counts = {PASS: 0, WARNING: 0, FAIL: 0}
+        results = []
+        for result in self.validation_results:
+            status = result.status
+            counts[status] = counts.get(status, 0) + 1
+            results.append(_result_row(result))
+        pass_count = counts[PASS]
+        warning_count = counts[WARNING]
+        fail_count = counts[FAIL]
+        overall_status = PASS
         if fail_count > 0:
-            overall_status = 'FAIL'
+            overall_status = FAIL
         elif warning_count > 0:
-            overall_status = 'WARNING'
+            overall_status = WARNING
         return {
             'overall_status': overall_status,
             'total_checks': len(self.validation_results),
             'pass_count': pass_count,
             'warning_count': warning_count,
             'fail_count': fail_count,
-            'results': [
-                {
-                    'check_name': result.check_name,
-                    'status': result.status,
-                    'message': result.message,
-                    'details': result.details
-                }
-                for result in self.validation_results
-            ]
+            'results': results
         }
 
     def print_summary(self):
@@ -388,7 +520,7 @@ class DWGValidator:
         print(f"Failed: {summary['fail_count']}")
         print()
         for result in summary['results']:
-            status_symbol = {'PASS': '✓', 'WARNING': '⚠', 'FAIL': '✗'}.get(result['status'], '?')
+            status_symbol = _STATUS_SYMBOLS.get(result['status'], '?')
             print(f"{status_symbol} {result['check_name']}: {result['message']}")
 
     def export_results(self, output_dir: str = ".", filename: str = None):
@@ -402,13 +534,34 @@ class DWGValidator:
         if not filename:
             filename = "validation_results.json"
         output_path = os.path.join(output_dir, filename)
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump([result.__dict__ for result in self.validation_results], f, indent=2)
+        payload = [_result_row(result) for result in self.validation_results]
+        if orjson is not None:
+            with open(output_path, "wb") as f:
+                f.write(orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+        else:
+            with open(output_path, "w", encoding="utf-8") as f:
+                json.dump(payload, f, indent=2)
         logger.info(f"Validation results exported to {output_path}")
 
+def _result_row(result: ValidationResult) -> Dict[str, Any]:
+    """Plain dict of a result; unlike asdict() it does not deep-copy the details"""
+    return {
+        'check_name': result.check_name,
+        'status': result.status,
+        'message': result.message,
+        'details': result.details
+    }
+
 def drawing_info_from_json(json_data: dict) -> DrawingInfo:
-    layers = [LayerInfo(**layer) for layer in json_data['layers']]
-    entities = [EntityInfo(**entity) for entity in json_data['entities']]
+    # Positional construction skips building a kwargs dict per record
+    layers = [
+        LayerInfo(layer['name'], layer['color'], layer['is_visible'], layer.get('line_type', 'CONTINUOUS'))
+        for layer in json_data['layers']
+    ]
+    entities = [
+        EntityInfo(entity['entity_type'], entity['layer'], entity['handle'], entity['data'])
+        for entity in json_data['entities']
+    ]
     return DrawingInfo(
         filename=json_data['filename'],
         version=json_data['version'],
@@ -420,6 +573,46 @@ def drawing_info_from_json(json_data: dict) -> DrawingInfo:
         blocks=json_data['blocks']
     )
 
+_batch_code_parser = None
+
+def _init_batch_worker(building_code_file: Optional[str]):
+    """Pool initializer: parse the building code once per worker process"""
+    global _batch_code_parser
+    _batch_code_parser = None
+    if building_code_file:
+        _batch_code_parser = OntarioBuildingCodeParserfromtext()
+        _batch_code_parser.parse_file(building_code_file)
+
+def _validate_one(path: str) -> Dict[str, Any]:
+    """Validate one DXF file or exported DrawingInfo JSON with a fresh validator"""
+    validator = DWGValidator(building_code_parser=_batch_code_parser)
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            validator.validate_file(drawing_info=drawing_info_from_json(json.load(f)))
+    else:
+        validator.validate_file(dwg_file_path=path)
+    return validator.get_summary()
+
+def validate_batch(
+    paths: List[str],
+    building_code_file: Optional[str] = None,
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """
+    Validate many drawings, each in its own worker process.
+    Returns one get_summary() dict per path, in input order.
+    """
+    if not paths:
+        return []
+    workers = min(workers or os.cpu_count() or 1, len(paths))
+    if workers <= 1:
+        _init_batch_worker(building_code_file)
+        return [_validate_one(path) for path in paths]
+    # Spawn rather than fork so a caller with live threads (the GUI) is not copied mid-flight
+    with multiprocessing.get_context('spawn').Pool(
+            workers, initializer=_init_batch_worker, initargs=(building_code_file,)) as pool:
+        return pool.map(_validate_one, paths)
+
 if __name__ == "__main__":
     # Example usage
     import sys
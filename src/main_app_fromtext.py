@@ -8,15 +8,93 @@ from tkinter import ttk, filedialog, messagebox, scrolledtext
 import os
 import json
 from typing import Optional
+from dataclasses import dataclass
 import threading
+import functools
+try:
+    # orjson formats result details and the exported summary natively; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+from collections import Counter, OrderedDict
+from operator import attrgetter, itemgetter
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor
 
 from .building_code_parser_text import OntarioBuildingCodeParserfromtext
 from .dwg_parser_text import DWGParser
-from .dwg_validator_text import DWGValidator
+from .dwg_validator_text import DWGValidator, ValidationResult, CHECK_FILE_PARSING, FAIL, _STATUS_SYMBOLS
+
+@dataclass(slots=True)
+class FileRef:
+    """A selected input file; the basename is worked out once at selection time"""
+    path: str
+    basename: str
+
+def _dumps(obj, indent: bool = False) -> str:
+    """Serialize obj to a JSON string, indented by two spaces if requested"""
+    if orjson is not None:
+        option = orjson.OPT_SERIALIZE_NUMPY | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option).decode()
+    return json.dumps(obj, indent=2 if indent else None, ensure_ascii=False)
+
+# One display line per building code measurement; %.50s truncates the context in place
+_CODE_MEASUREMENT_LINE = "  • %s %s - %.50s...\n"
+_code_measurement_fields = itemgetter('value', 'unit', 'context')
+
+def _write_json(path: str, obj):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(_dumps(obj, indent=True))
+
+def _paginate(iterable, page_size: int):
+    """Yield successive lists of up to page_size items"""
+    iterator = iter(iterable)
+    while True:
+        page = list(islice(iterator, page_size))
+        if not page:
+            return
+        yield page
+
+def _file_key(path: str):
+    """Cache key that changes whenever the file is rewritten, None if it cannot be read"""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (path, stat.st_mtime, stat.st_size)
+
+def _gui_action(busy_message: str, error_message: str):
+    """
+    Decorate a button handler that returns a (worker, on_done) job, or None to stop.
+    The worker runs on a background thread while busy_message is shown and on_done gets
+    its result on the Tk thread; a failure in the handler itself, the worker or on_done
+    is reported under error_message.
+    """
+    def decorate(handler):
+        @functools.wraps(handler)
+        def wrapper(self):
+            try:
+                job = handler(self)
+            except Exception as e:
+                self._async_failed(error_message, e)
+                return
+            if job is not None:
+                self.status_var.set(busy_message)
+                worker, on_done = job
+                self._run_async(worker, on_done, error_message)
+        return wrapper
+    return decorate
 
 class BuildingCodeDWGApp:
     """Main application class"""
     
+    # Parsed files kept per parser; repeat clicks on an unchanged file skip parsing
+    PARSE_CACHE_SIZE = 4
+    # Report lines written to a results tab at once; Load More appends the next page
+    PAGE_SIZE = 100
+    # DWG/DXF files above this size are only loaded after the user confirms
+    MAX_FAST_SIZE = 50 * 1024 * 1024
+    
     def __init__(self, root):
         self.root = root
         self.root.title("Building Code & DWG Analysis Tool")
@@ -25,11 +103,19 @@ class BuildingCodeDWGApp:
         # Initialize parsers
         self.building_code_parser = OntarioBuildingCodeParserfromtext()
         self.dwg_parser = DWGParser()
-        self.validator = DWGValidator()
-        
-        # File paths
-        self.building_code_file = None
-        self.dwg_file = None
+        # The validator reads measurements from the app's parser, so it can
+        # validate an already parsed drawing
+        self.validator = DWGValidator(dwg_parser=self.dwg_parser)
+        self._bc_cache = OrderedDict()
+        self._dwg_cache = OrderedDict()
+        # Set while a parse/validation runs on the worker thread
+        self._busy = False
+        # Results tab -> (next page, remaining pages) still to be shown
+        self._pending_pages = {}
+        
+        # Selected files
+        self.building_code_file: Optional[FileRef] = None
+        self.dwg_file: Optional[FileRef] = None
         
         self.setup_ui()
     
@@ -79,20 +165,29 @@ class BuildingCodeDWGApp:
         control_frame.columnconfigure(2, weight=1)
         
         # Parse buttons
-        ttk.Button(control_frame, text="Parse Building Code", 
-                  command=self.parse_building_code).grid(row=0, column=0, padx=5, pady=5, sticky=(tk.W, tk.E))
-        ttk.Button(control_frame, text="Parse DWG File", 
-                  command=self.parse_dwg_file).grid(row=0, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
-        ttk.Button(control_frame, text="Validate DWG", 
-                  command=self.validate_dwg).grid(row=0, column=2, padx=5, pady=5, sticky=(tk.W, tk.E))
+        parse_bc_button = ttk.Button(control_frame, text="Parse Building Code", 
+                  command=self.parse_building_code)
+        parse_bc_button.grid(row=0, column=0, padx=5, pady=5, sticky=(tk.W, tk.E))
+        parse_dwg_button = ttk.Button(control_frame, text="Parse DWG File", 
+                  command=self.parse_dwg_file)
+        parse_dwg_button.grid(row=0, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
+        validate_button = ttk.Button(control_frame, text="Validate DWG", 
+                  command=self.validate_dwg)
+        validate_button.grid(row=0, column=2, padx=5, pady=5, sticky=(tk.W, tk.E))
         
         # Analysis buttons
-        ttk.Button(control_frame, text="Compare with Codes", 
-                  command=self.compare_with_codes).grid(row=1, column=0, padx=5, pady=5, sticky=(tk.W, tk.E))
-        ttk.Button(control_frame, text="Export Results", 
-                  command=self.export_results).grid(row=1, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
-        ttk.Button(control_frame, text="Clear All", 
-                  command=self.clear_all).grid(row=1, column=2, padx=5, pady=5, sticky=(tk.W, tk.E))
+        compare_button = ttk.Button(control_frame, text="Compare with Codes", 
+                  command=self.compare_with_codes)
+        compare_button.grid(row=1, column=0, padx=5, pady=5, sticky=(tk.W, tk.E))
+        export_button = ttk.Button(control_frame, text="Export Results", 
+                  command=self.export_results)
+        export_button.grid(row=1, column=1, padx=5, pady=5, sticky=(tk.W, tk.E))
+        clear_button = ttk.Button(control_frame, text="Clear All", 
+                  command=self.clear_all)
+        clear_button.grid(row=1, column=2, padx=5, pady=5, sticky=(tk.W, tk.E))
+        # Disabled together while a background job uses the parsers
+        self._action_buttons = (parse_bc_button, parse_dwg_button, validate_button,
+                                compare_button, export_button, clear_button)
         
         # Results notebook
         self.notebook = ttk.Notebook(main_frame)
@@ -119,11 +214,125 @@ class BuildingCodeDWGApp:
         self.validation_text = scrolledtext.ScrolledText(self.validation_frame, wrap=tk.WORD)
         self.validation_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # The read-only result tabs do not take keyboard focus, so Page Down is
+        # bound on the notebook; the button works wherever the focus is
+        self._tab_texts = (self.building_code_text, self.dwg_text, self.validation_text)
+        self.notebook.bind("<Next>", self._load_more)
+        self.notebook.bind("<<NotebookTabChanged>>", self._update_load_more)
+        
         # Status bar
         self.status_var = tk.StringVar()
         self.status_var.set("Ready")
         status_bar = ttk.Label(main_frame, textvariable=self.status_var, relief=tk.SUNKEN)
-        status_bar.grid(row=4, column=0, columnspan=3, sticky=(tk.W, tk.E), pady=(10, 0))
+        status_bar.grid(row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(10, 0))
+        self.load_more_button = ttk.Button(main_frame, text="Load More", command=self._load_more)
+        self.load_more_button.grid(row=4, column=2, padx=(5, 0), pady=(10, 0), sticky=tk.E)
+        self.load_more_button.state(['disabled'])
+    
+    def _cache_store(self, cache: OrderedDict, key, value):
+        cache[key] = value
+        if len(cache) > self.PARSE_CACHE_SIZE:
+            cache.popitem(last=False)
+    
+    def _cached_parse_bc(self, path: str):
+        """Parse a building code file, reusing the structure of an unchanged file"""
+        key = _file_key(path)
+        structure = self._bc_cache.get(key)
+        if structure is None:
+            structure = self.building_code_parser.parse_file(path)
+            if key is not None and structure is not None:
+                self._cache_store(self._bc_cache, key, structure)
+        else:
+            self._bc_cache.move_to_end(key)
+            self.building_code_parser.structure = structure
+        return structure
+    
+    def _cached_parse_dwg(self, path: str):
+        """Parse a DWG/DXF file, reusing the drawing and measurements of an unchanged file"""
+        key = _file_key(path)
+        cached = self._dwg_cache.get(key)
+        if cached is None:
+            drawing_info = self.dwg_parser.parse_file(path)
+            if key is not None and drawing_info is not None:
+                self._cache_store(self._dwg_cache, key, (drawing_info, self.dwg_parser.measurements))
+        else:
+            self._dwg_cache.move_to_end(key)
+            drawing_info, self.dwg_parser.measurements = cached
+            self.dwg_parser.drawing_info = drawing_info
+        return drawing_info
+    
+    def _confirm_large_dwg(self, path: str) -> bool:
+        """Ask before loading a large DWG/DXF file that is not parsed yet"""
+        key = _file_key(path)
+        if key is None or key in self._dwg_cache or key[2] <= self.MAX_FAST_SIZE:
+            return True
+        return messagebox.askokcancel(
+            "Large file",
+            f"{os.path.basename(path)} is {key[2] // 1_000_000} MB and may take minutes to load. Continue?")
+    
+    def _set_busy(self, busy: bool):
+        self._busy = busy
+        state = ['disabled'] if busy else ['!disabled']
+        for button in self._action_buttons:
+            button.state(state)
+    
+    def _run_async(self, worker, on_done, error_message: str):
+        """Run worker on a background thread and pass its result to on_done on the Tk thread"""
+        self._set_busy(True)
+        
+        def run():
+            try:
+                result = worker()
+            except Exception as e:
+                self.root.after(0, self._async_failed, error_message, e)
+            else:
+                self.root.after(0, self._async_done, on_done, result, error_message)
+        
+        threading.Thread(target=run, daemon=True).start()
+    
+    def _async_done(self, on_done, result, error_message: str):
+        self._set_busy(False)
+        try:
+            on_done(result)
+        except Exception as e:
+            self._async_failed(error_message, e)
+    
+    def _async_failed(self, error_message: str, error: Exception):
+        self._set_busy(False)
+        messagebox.showerror("Error", f"{error_message}: {str(error)}")
+        self.status_var.set(error_message)
+    
+    def _set_text(self, widget, lines):
+        """Replace a results tab's text with the first page of lines; the tab stays read-only"""
+        pages = _paginate(lines, self.PAGE_SIZE)
+        self._pending_pages[widget] = (next(pages, []), pages)
+        widget.configure(state='normal')
+        widget.delete(1.0, tk.END)
+        self._write_page(widget)
+    
+    def _write_page(self, widget):
+        """Append the next pending page of a results tab"""
+        page, pages = self._pending_pages.pop(widget)
+        widget.configure(state='normal')
+        if widget.tag_ranges('more'):
+            widget.delete('more.first', 'more.last')
+        widget.insert(tk.END, ''.join(page))
+        next_page = next(pages, None)
+        if next_page is not None:
+            self._pending_pages[widget] = (next_page, pages)
+            widget.insert(tk.END, "\n-- More results: Load More --\n", 'more')
+        widget.configure(state='disabled')
+        self._update_load_more()
+    
+    def _load_more(self, event=None):
+        widget = self._tab_texts[self.notebook.index('current')]
+        if widget in self._pending_pages:
+            self._write_page(widget)
+    
+    def _update_load_more(self, event=None):
+        """Enable Load More only while the selected tab has pages left"""
+        widget = self._tab_texts[self.notebook.index('current')]
+        self.load_more_button.state(['!disabled'] if widget in self._pending_pages else ['disabled'])
     
     def browse_building_code_file(self):
         """Browse for building code file"""
@@ -132,9 +341,9 @@ class BuildingCodeDWGApp:
             filetypes=[("Text files", "*.txt"), ("All files", "*.*")]
         )
         if file_path:
-            self.building_code_file = file_path
-            self.building_code_var.set(os.path.basename(file_path))
-            self.status_var.set(f"Building code file selected: {os.path.basename(file_path)}")
+            self.building_code_file = FileRef(file_path, os.path.basename(file_path))
+            self.building_code_var.set(self.building_code_file.basename)
+            self.status_var.set(f"Building code file selected: {self.building_code_file.basename}")
     
     def browse_dwg_file(self):
         """Browse for DWG/DXF file"""
@@ -143,255 +352,268 @@ class BuildingCodeDWGApp:
             filetypes=[("DXF files", "*.dxf"), ("DWG files", "*.dwg"), ("All files", "*.*")]
         )
         if file_path:
-            self.dwg_file = file_path
-            self.dwg_file_var.set(os.path.basename(file_path))
-            self.status_var.set(f"DWG file selected: {os.path.basename(file_path)}")
+            self.dwg_file = FileRef(file_path, os.path.basename(file_path))
+            self.dwg_file_var.set(self.dwg_file.basename)
+            self.status_var.set(f"DWG file selected: {self.dwg_file.basename}")
     
+    @_gui_action("Parsing building code...", "Error parsing building code")
     def parse_building_code(self):
         """Parse building code file"""
         if not self.building_code_file:
             messagebox.showerror("Error", "Please select a building code file first.")
-            return
+            return None
         
-        self.status_var.set("Parsing building code...")
-        self.root.update()
+        path = self.building_code_file.path
+        return lambda: self._cached_parse_bc(path), self._show_building_code
+    
+    def _show_building_code(self, structure):
+        """Display a parsed building code structure"""
+        lines = ["Building Code Parse Results\n", "=" * 50 + "\n\n"]
         
-        try:
-            structure = self.building_code_parser.parse_file(self.building_code_file)
+        if structure and structure.divisions:
+            lines.append(f"Total divisions found: {len(structure.divisions)}\n")
             
-            # Display results
-            self.building_code_text.delete(1.0, tk.END)
-            self.building_code_text.insert(tk.END, "Building Code Parse Results\n")
-            self.building_code_text.insert(tk.END, "=" * 50 + "\n\n")
+            # Part and section totals in one walk of the tree
+            total_parts = 0
+            total_sections = 0
+            for div in structure.divisions:
+                parts = div.parts or ()
+                total_parts += len(parts)
+                for part in parts:
+                    total_sections += len(part.sections or ())
+            measurements = structure.measurements
+            requirements = structure.requirements
             
-            if structure and structure.divisions:
-                self.building_code_text.insert(tk.END, f"Total divisions found: {len(structure.divisions)}\n")
-                
-                total_parts = sum(len(div.parts) for div in structure.divisions if div.parts)
-                total_sections = sum(len(part.sections) for div in structure.divisions if div.parts for part in div.parts if part.sections)
-                
-                self.building_code_text.insert(tk.END, f"Total parts: {total_parts}\n")
-                self.building_code_text.insert(tk.END, f"Total sections: {total_sections}\n")
-                self.building_code_text.insert(tk.END, f"Total measurements: {len(structure.measurements)}\n")
-                self.building_code_text.insert(tk.END, f"Total requirements: {len(structure.requirements)}\n\n")
-                
-                # Display divisions and their content
-                for division in structure.divisions:
-                    self.building_code_text.insert(tk.END, f"Division {division.letter}\n")
-                    self.building_code_text.insert(tk.END, "-" * 30 + "\n")
-                    
-                    if division.parts:
-                        for part in division.parts[:3]:  # Show first 3 parts
-                            self.building_code_text.insert(tk.END, f"  Part {part.number}: {part.title}\n")
-                            
-                            if part.sections:
-                                for section in part.sections[:2]:  # Show first 2 sections per part
-                                    self.building_code_text.insert(tk.END, f"    Section {section.number}: {section.title}\n")
-                    
-                    self.building_code_text.insert(tk.END, "\n")
+            lines.append(f"Total parts: {total_parts}\n")
+            lines.append(f"Total sections: {total_sections}\n")
+            lines.append(f"Total measurements: {len(measurements)}\n")
+            lines.append(f"Total requirements: {len(requirements)}\n\n")
+            
+            # Display divisions and their content
+            for division in structure.divisions:
+                lines.append(f"Division {division.letter}\n")
+                lines.append("-" * 30 + "\n")
                 
-                # Display measurements
-                if structure.measurements:
-                    self.building_code_text.insert(tk.END, "Measurements found:\n")
-                    for measurement in structure.measurements[:10]:  # Show first 10 measurements
-                        self.building_code_text.insert(tk.END, 
-                            f"  • {measurement['value']} {measurement['unit']} - {measurement['context'][:50]}...\n")
+                if division.parts:
+                    for part in islice(division.parts, 3):  # Show first 3 parts
+                        lines.append(f"  Part {part.number}: {part.title}\n")
+                        
+                        if part.sections:
+                            for section in islice(part.sections, 2):  # Show first 2 sections per part
+                                lines.append(f"    Section {section.number}: {section.title}\n")
                 
-                # Display requirements
-                if structure.requirements:
-                    self.building_code_text.insert(tk.END, "\nRequirements found:\n")
-                    for req in structure.requirements[:5]:  # Show first 5 requirements
-                        self.building_code_text.insert(tk.END, f"  • {req[:100]}...\n")
-            else:
-                self.building_code_text.insert(tk.END, "No structure found in the building code file.\n")
+                lines.append("\n")
             
-            # Switch to building code tab
-            self.notebook.select(0)
-            self.status_var.set("Building code parsed successfully")
+            # Display measurements
+            if measurements:
+                lines.append("Measurements found:\n")
+                # Show first 10 measurements
+                lines.extend([_CODE_MEASUREMENT_LINE % _code_measurement_fields(m) for m in islice(measurements, 10)])
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Error parsing building code: {str(e)}")
-            self.status_var.set("Error parsing building code")
+            # Display requirements
+            if requirements:
+                lines.append("\nRequirements found:\n")
+                for req in islice(requirements, 5):  # Show first 5 requirements
+                    lines.append(f"  • {req[:100]}...\n")
+        else:
+            lines.append("No structure found in the building code file.\n")
+        
+        self._set_text(self.building_code_text, lines)
+        
+        # Switch to building code tab
+        self.notebook.select(0)
+        self.status_var.set("Building code parsed successfully")
     
+    @_gui_action("Parsing DWG file...", "Error parsing DWG file")
     def parse_dwg_file(self):
         """Parse DWG file"""
         if not self.dwg_file:
             messagebox.showerror("Error", "Please select a DWG/DXF file first.")
-            return
+            return None
         
-        self.status_var.set("Parsing DWG file...")
-        self.root.update()
+        path = self.dwg_file.path
+        if not self._confirm_large_dwg(path):
+            return None
         
-        try:
-            drawing_info = self.dwg_parser.parse_file(self.dwg_file)
+        return lambda: self._cached_parse_dwg(path), self._show_dwg
+    
+    def _show_dwg(self, drawing_info):
+        """Display a parsed drawing"""
+        lines = ["DWG Parse Results\n", "=" * 50 + "\n\n"]
+        
+        if drawing_info:
+            lines.append(f"File: {drawing_info.filename}\n")
+            lines.append(f"Version: {drawing_info.version}\n")
+            lines.append(f"Units: {drawing_info.units}\n")
+            lines.append(f"Layers: {len(drawing_info.layers)}\n")
+            lines.append(f"Entities: {len(drawing_info.entities)}\n")
+            lines.append(f"Dimensions: {len(drawing_info.dimensions)}\n")
+            lines.append(f"Text entities: {len(drawing_info.text_entities)}\n")
+            lines.append(f"Blocks: {len(drawing_info.blocks)}\n\n")
             
-            # Display results
-            self.dwg_text.delete(1.0, tk.END)
-            self.dwg_text.insert(tk.END, "DWG Parse Results\n")
-            self.dwg_text.insert(tk.END, "=" * 50 + "\n\n")
+            # Entity type breakdown
+            entity_types = Counter(map(attrgetter('entity_type'), drawing_info.entities))
             
-            if drawing_info:
-                self.dwg_text.insert(tk.END, f"File: {drawing_info.filename}\n")
-                self.dwg_text.insert(tk.END, f"Version: {drawing_info.version}\n")
-                self.dwg_text.insert(tk.END, f"Units: {drawing_info.units}\n")
-                self.dwg_text.insert(tk.END, f"Layers: {len(drawing_info.layers)}\n")
-                self.dwg_text.insert(tk.END, f"Entities: {len(drawing_info.entities)}\n")
-                self.dwg_text.insert(tk.END, f"Dimensions: {len(drawing_info.dimensions)}\n")
-                self.dwg_text.insert(tk.END, f"Text entities: {len(drawing_info.text_entities)}\n")
-                self.dwg_text.insert(tk.END, f"Blocks: {len(drawing_info.blocks)}\n\n")
-                
-                # Entity type breakdown
-                entity_types = {}
-                for entity in drawing_info.entities:
-                    entity_type = entity.entity_type
-                    entity_types[entity_type] = entity_types.get(entity_type, 0) + 1
-                
-                self.dwg_text.insert(tk.END, "Entity Types:\n")
-                for entity_type, count in sorted(entity_types.items()):
-                    self.dwg_text.insert(tk.END, f"  {entity_type}: {count}\n")
-                
-                # Layer information
-                self.dwg_text.insert(tk.END, "\nLayers:\n")
-                for layer in drawing_info.layers[:10]:  # Show first 10 layers
-                    self.dwg_text.insert(tk.END, f"  {layer.name} (color: {layer.color}, visible: {layer.is_visible})\n")
-                
-                # Measurements
-                measurements = self.dwg_parser.get_measurements()
-                if measurements:
-                    self.dwg_text.insert(tk.END, f"\nMeasurements ({len(measurements)} total):\n")
-                    for measurement in measurements[:10]:  # Show first 10 measurements
-                        self.dwg_text.insert(tk.END, f"  {measurement['type']}: {measurement['value']} (layer: {measurement['layer']})\n")
-            else:
-                self.dwg_text.insert(tk.END, "Could not parse DWG file.\n")
+            lines.append("Entity Types:\n")
+            for entity_type, count in entity_types.most_common(20):  # Show 20 most common types
+                lines.append(f"  {entity_type}: {count}\n")
             
-            # Switch to DWG tab
-            self.notebook.select(1)
-            self.status_var.set("DWG file parsed successfully")
+            # Layer information
+            lines.append("\nLayers:\n")
+            for layer in islice(drawing_info.layers, 10):  # Show first 10 layers
+                lines.append(f"  {layer.name} (color: {layer.color}, visible: {layer.is_visible})\n")
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Error parsing DWG file: {str(e)}")
-            self.status_var.set("Error parsing DWG file")
+            # Measurements
+            measurements = self.dwg_parser.get_measurements()
+            if measurements:
+                lines.append(f"\nMeasurements ({len(measurements)} total):\n")
+                for measurement in islice(measurements, 10):  # Show first 10 measurements
+                    lines.append(f"  {measurement['type']}: {measurement['value']} (layer: {measurement['layer']})\n")
+        else:
+            lines.append("Could not parse DWG file.\n")
+        
+        self._set_text(self.dwg_text, lines)
+        
+        # Switch to DWG tab
+        self.notebook.select(1)
+        self.status_var.set("DWG file parsed successfully")
     
+    @_gui_action("Validating DWG file...", "Error validating DWG file")
     def validate_dwg(self):
         """Validate DWG file"""
         if not self.dwg_file:
             messagebox.showerror("Error", "Please select a DWG/DXF file first.")
-            return
-        
-        self.status_var.set("Validating DWG file...")
-        self.root.update()
-        
-        try:
-            # Set building code parser if available
-            if self.building_code_parser.structure:
-                self.validator.building_code_parser = self.building_code_parser
-            
-            validation_results = self.validator.validate_file(self.dwg_file)
-            
-            # Display results
-            self.validation_text.delete(1.0, tk.END)
-            self.validation_text.insert(tk.END, "DWG Validation Results\n")
-            self.validation_text.insert(tk.END, "=" * 50 + "\n\n")
-            
-            if validation_results:
-                summary = self.validator.get_summary()
-                self.validation_text.insert(tk.END, f"Overall Status: {summary['overall_status']}\n")
-                self.validation_text.insert(tk.END, f"Total Checks: {summary['total_checks']}\n")
-                self.validation_text.insert(tk.END, f"Passed: {summary['pass_count']}\n")
-                self.validation_text.insert(tk.END, f"Warnings: {summary['warning_count']}\n")
-                self.validation_text.insert(tk.END, f"Failed: {summary['fail_count']}\n\n")
-                
-                for result in validation_results:
-                    status_symbol = {'PASS': '✓', 'WARNING': '⚠', 'FAIL': '✗'}[result.status]
-                    self.validation_text.insert(tk.END, f"{status_symbol} {result.check_name}\n")
-                    self.validation_text.insert(tk.END, f"   {result.message}\n")
-                    if result.details:
-                        self.validation_text.insert(tk.END, f"   Details: {json.dumps(result.details, indent=2)}\n")
-                    self.validation_text.insert(tk.END, "\n")
-            else:
-                self.validation_text.insert(tk.END, "No validation results available.\n")
-            
-            # Switch to validation tab
-            self.notebook.select(2)
-            self.status_var.set("DWG validation completed")
+            return None
+        
+        path = self.dwg_file.path
+        if not self._confirm_large_dwg(path):
+            return None
+        
+        # Set building code parser if available
+        if self.building_code_parser.structure:
+            self.validator.building_code_parser = self.building_code_parser
+        
+        def validate():
+            drawing_info = self._cached_parse_dwg(path)
+            if drawing_info is None:
+                # Record the failed parse instead of letting the validator load the file again
+                self.validator.validation_results = [
+                    ValidationResult(CHECK_FILE_PARSING, FAIL, "Could not parse DWG file", {})]
+                return self.validator.validation_results
+            return self.validator.validate_file(drawing_info=drawing_info)
+        
+        return validate, self._show_validation
+    
+    def _show_validation(self, validation_results):
+        """Display validation results"""
+        lines = ["DWG Validation Results\n", "=" * 50 + "\n\n"]
+        
+        if validation_results:
+            summary = self.validator.get_summary()
+            lines.append(f"Overall Status: {summary['overall_status']}\n")
+            lines.append(f"Total Checks: {summary['total_checks']}\n")
+            lines.append(f"Passed: {summary['pass_count']}\n")
+            lines.append(f"Warnings: {summary['warning_count']}\n")
+            lines.append(f"Failed: {summary['fail_count']}\n\n")
             
-        except Exception as e:
-            messagebox.showerror("Error", f"Error validating DWG file: {str(e)}")
-            self.status_var.set("Error validating DWG file")
+            append = lines.append
+            symbols = _STATUS_SYMBOLS
+            for result in validation_results:
+                details = result.details
+                if details:
+                    append(f"{symbols[result.status]} {result.check_name}\n   {result.message}\n"
+                           f"   Details: {_dumps(details, indent=True)}\n\n")
+                else:
+                    append(f"{symbols[result.status]} {result.check_name}\n   {result.message}\n\n")
+        else:
+            lines.append("No validation results available.\n")
+        
+        self._set_text(self.validation_text, lines)
+        
+        # Switch to validation tab
+        self.notebook.select(2)
+        self.status_var.set("DWG validation completed")
     
+    @_gui_action("Comparing with building codes...", "Error comparing with codes")
     def compare_with_codes(self):
         """Compare DWG measurements with building codes"""
         if not self.building_code_parser.structure:
             messagebox.showwarning("Warning", "Please parse building code file first.")
-            return
+            return None
         
         if not self.dwg_parser.drawing_info:
             messagebox.showwarning("Warning", "Please parse DWG file first.")
-            return
+            return None
         
-        self.status_var.set("Comparing with building codes...")
-        self.root.update()
+        # Get measurements from both sources
+        def measurements():
+            return self.building_code_parser.structure.measurements, self.dwg_parser.get_measurements()
         
-        try:
-            # Get measurements from both sources
-            code_measurements = self.building_code_parser.structure.measurements
-            dwg_measurements = self.dwg_parser.get_measurements()
-            
-            # Display comparison
-            self.validation_text.delete(1.0, tk.END)
-            self.validation_text.insert(tk.END, "Building Code vs DWG Comparison\n")
-            self.validation_text.insert(tk.END, "=" * 50 + "\n\n")
-            
-            self.validation_text.insert(tk.END, f"Building Code Measurements: {len(code_measurements)}\n")
-            self.validation_text.insert(tk.END, f"DWG Measurements: {len(dwg_measurements)}\n\n")
-            
-            if code_measurements:
-                self.validation_text.insert(tk.END, "Building Code Measurements:\n")
-                for measurement in code_measurements[:10]:  # Show first 10
-                    self.validation_text.insert(tk.END, 
-                        f"  • {measurement['value']} {measurement['unit']} - {measurement['context'][:50]}...\n")
-            
-            if dwg_measurements:
-                self.validation_text.insert(tk.END, "\nDWG Measurements:\n")
-                for measurement in dwg_measurements[:10]:  # Show first 10
-                    self.validation_text.insert(tk.END, 
-                        f"  • {measurement['value']} ({measurement['type']}) - Layer: {measurement['layer']}\n")
-            
-            # Switch to validation tab
-            self.notebook.select(2)
-            self.status_var.set("Comparison completed")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error comparing with codes: {str(e)}")
-            self.status_var.set("Error in comparison")
+        return measurements, self._show_comparison
+    
+    def _show_comparison(self, measurements):
+        """Display building code and DWG measurements side by side"""
+        code_measurements, dwg_measurements = measurements
+        lines = ["Building Code vs DWG Comparison\n", "=" * 50 + "\n\n"]
+        
+        lines.append(f"Building Code Measurements: {len(code_measurements)}\n")
+        lines.append(f"DWG Measurements: {len(dwg_measurements)}\n\n")
+        
+        if code_measurements:
+            lines.append("Building Code Measurements:\n")
+            # Show first 10
+            lines.extend([_CODE_MEASUREMENT_LINE % _code_measurement_fields(m) for m in islice(code_measurements, 10)])
+        
+        if dwg_measurements:
+            lines.append("\nDWG Measurements:\n")
+            for measurement in islice(dwg_measurements, 10):  # Show first 10
+                lines.append(
+                    f"  • {measurement['value']} ({measurement['type']}) - Layer: {measurement['layer']}\n")
+        
+        self._set_text(self.validation_text, lines)
+        
+        # Switch to validation tab
+        self.notebook.select(2)
+        self.status_var.set("Comparison completed")
     
+    @_gui_action("Exporting results...", "Error exporting results")
     def export_results(self):
         """Export results to files"""
         export_dir = filedialog.askdirectory(title="Select Export Directory")
         if not export_dir:
-            return
+            return None
         
-        try:
+        return lambda: self._export_files(export_dir), self._show_exported
+    
+    def _export_files(self, export_dir: str) -> str:
+        """Write the JSON exports to export_dir and return it"""
+        bc_path = os.path.join(export_dir, "building_code_results.json")
+        dwg_path = os.path.join(export_dir, "dwg_results.json")
+        validation_path = os.path.join(export_dir, "validation_results.json")
+        
+        # The three files are independent, so they are written side by side
+        tasks = []
+        with ThreadPoolExecutor(max_workers=3) as executor:
             # Export building code results
             if self.building_code_parser.structure:
-                self.building_code_parser.export_to_json(os.path.join(export_dir, "building_code_results.json"))
+                tasks.append(executor.submit(self.building_code_parser.export_to_json, bc_path))
             
             # Export DWG results
             if self.dwg_parser.drawing_info:
-                self.dwg_parser.export_to_json(os.path.join(export_dir, "dwg_results.json"))
+                tasks.append(executor.submit(self.dwg_parser.export_to_json, dwg_path))
             
             # Export validation results
             if self.validator.validation_results:
                 summary = self.validator.get_summary()
-                with open(os.path.join(export_dir, "validation_results.json"), 'w') as f:
-                    json.dump(summary, f, indent=2)
-            
-            messagebox.showinfo("Success", f"Results exported to {export_dir}")
-            self.status_var.set("Results exported successfully")
-            
-        except Exception as e:
-            messagebox.showerror("Error", f"Error exporting results: {str(e)}")
-            self.status_var.set("Error exporting results")
+                tasks.append(executor.submit(_write_json, validation_path, summary))
+        # Re-raise the first failure, if any
+        for task in tasks:
+            task.result()
+        return export_dir
+    
+    def _show_exported(self, export_dir: str):
+        messagebox.showinfo("Success", f"Results exported to {export_dir}")
+        self.status_var.set("Results exported successfully")
     
     def clear_all(self):
         """Clear all data and results"""
@@ -400,13 +622,17 @@ class BuildingCodeDWGApp:
         self.building_code_var.set("")
         self.dwg_file_var.set("")
         
-        self.building_code_parser = OntarioBuildingCodeParserfromtext()
-        self.dwg_parser = DWGParser()
-        self.validator = DWGValidator()
-        
-        self.building_code_text.delete(1.0, tk.END)
-        self.dwg_text.delete(1.0, tk.END)
-        self.validation_text.delete(1.0, tk.END)
+        # Reset in place so the parsers keep their compiled patterns
+        self.building_code_parser.reset()
+        self.dwg_parser.reset()
+        self.validator.reset()
+        self.validator.building_code_parser = None
+        self._bc_cache.clear()
+        self._dwg_cache.clear()
+        
+        self._set_text(self.building_code_text, [])
+        self._set_text(self.dwg_text, [])
+        self._set_text(self.validation_text, [])
         
         self.status_var.set("All data cleared")
         self.notebook.select(0)
@@ -1,6 +1,6 @@
 import unittest
 from unittest.mock import patch, mock_open
-from src.building_code_parser_text import OntarioBuildingCodeParserfromtext, BuildingCodeStructure, Section
+from src.building_code_parser_text import OntarioBuildingCodeParserfromtext, BuildingCodeStructure, Division, Part, Section
 import textwrap
 
 class TestOntarioBuildingCodeParserfromtext(unittest.TestCase):
@@ -63,16 +63,34 @@ Title of Subarticle 2.1.1.1
         result = self.parser.get_measurements_by_unit('meters')
         self.assertEqual(len(result), 1)
 
+    def test_extract_measurements_units(self):
+        structure = self.parser.parse_content("Division A\nRise of 300 mm, run of 3 m and a landing of minimum 3 m.\n")
+        measurements = structure.measurements
+        self.assertEqual([(m['value'], m['unit']) for m in measurements],
+                         [(300.0, 'millimeters'), (3.0, 'meters'), (3.0, 'meters')])
+        self.assertEqual(measurements[2].full_match, "minimum 3 m")
+
+    def test_measurement_reads_like_a_dict(self):
+        structure = self.parser.parse_content("Division A\nGuards shall be 900 mm high.\n")
+        measurement = structure.measurements[0]
+        self.assertEqual(measurement['context'], "Guards shall be 900 mm high.")
+        self.assertEqual(measurement['full_match'], "900 mm")
+        self.assertEqual(measurement.get('unit'), 'millimeters')
+        self.assertIsNone(measurement.get('start'))
+        self.assertIn('context', measurement)
+        self.assertEqual(list(measurement), ['value', 'unit', 'context', 'full_match'])
+        self.assertEqual(dict(measurement)['value'], 900.0)
+
     def test_get_requirements_by_keyword(self):
         self.parser.structure = BuildingCodeStructure(divisions=[], measurements=[], requirements=["shall be concrete.", "must be steel."])
         result = self.parser.get_requirements_by_keyword('concrete')
         self.assertEqual(result, ["shall be concrete."])
 
     def test_find_section_by_number(self):
-        section = Section(number="1.1", title="Test", content="", articles=[])
+        section = Section(number="1.1", title="Test", start=0, end=0, articles=[])
         self.parser.structure = BuildingCodeStructure(
             divisions=[
-                type('Division', (), {'parts': [type('Part', (), {'sections': [section]})()]})()
+                Division("A", 0, 0, [Part("1", "Test", 0, 0, [section])])
             ],
             measurements=[],
             requirements=[]
@@ -80,6 +98,35 @@ Title of Subarticle 2.1.1.1
         found = self.parser.find_section_by_number("1.1")
         self.assertEqual(found, section)
 
+    def test_find_section_by_number_after_reparse(self):
+        self.parser.parse_content(self.sample_content)
+        self.assertEqual(self.parser.find_section_by_number("2.1").title, "Title of Section 2.1")
+        self.assertEqual(self.parser.find_article_by_number("1.1.1").title, "Title of Article 1.1.1")
+        self.parser.structure = BuildingCodeStructure(divisions=[], measurements=[], requirements=[])
+        self.assertIsNone(self.parser.find_section_by_number("2.1"))
+
+    def test_reset_clears_structure(self):
+        self.parser.parse_content(self.sample_content)
+        self.assertIsNotNone(self.parser.find_section_by_number("2.1"))
+        self.parser.reset()
+        self.assertIsNone(self.parser.structure)
+        self.assertIsNone(self.parser.find_section_by_number("2.1"))
+        self.parser.parse_content(self.sample_content)
+        self.assertEqual(self.parser.find_section_by_number("2.1").title, "Title of Section 2.1")
+
+    def test_parallel_parse_matches_serial(self):
+        content = self.sample_content + "2) Guards shall be not less than 900 mm high.\n"
+        serial = self.parser.parse_content(content)
+        parallel_parser = OntarioBuildingCodeParserfromtext()
+        parallel_parser.PARALLEL_THRESHOLD = 0
+        # One worker per division; the pool path needs more than one CPU
+        with patch("src.building_code_parser_text.os.cpu_count", return_value=2):
+            parallel = parallel_parser.parse_content(content)
+        self.assertEqual(parallel.divisions, serial.divisions)
+        self.assertEqual(parallel.measurements, serial.measurements)
+        self.assertEqual(parallel.requirements, serial.requirements)
+        self.assertEqual(len(parallel.measurements), 1)
+
     @patch("builtins.open", new_callable=mock_open)
     def test_export_to_json(self, mock_file):
         self.parser.structure = BuildingCodeStructure(divisions=[], measurements=[], requirements=[])
@@ -1,6 +1,16 @@
+import json
+import os
+import tempfile
 import unittest
 from unittest.mock import patch, MagicMock
-from src.dwg_parser_text import DWGParser
+
+import ezdxf
+import numpy as np
+
+import src.dwg_parser_text as dwg_parser_text
+from src.dwg_parser_text import DWGParser, DrawingInfo, LayerInfo, EntityInfo
+
+SAMPLE_DXF = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'Drawing.dxf')
 
 class TestDWGParser(unittest.TestCase):
     def setUp(self):
@@ -21,3 +31,119 @@ class TestDWGParser(unittest.TestCase):
         self.assertIsNotNone(result)
         self.assertEqual(result.version, 'AC1027')
         self.assertEqual(result.units, 'meters')
+
+    def _export_fixture(self):
+        entities = [
+            EntityInfo('LINE', 'A-WALL', format(i, 'X'),
+                       {'start': (0.0, 0.0, 0.0), 'end': (i * 0.5, 1.25, 0.0), 'length': i + 0.1})
+            for i in range(1500)
+        ]
+        self.parser.drawing_info = DrawingInfo(
+            filename="plan.dxf",
+            version="AC1027",
+            units="millimeters",
+            layers=[LayerInfo("A-WALL", 7, True), LayerInfo("Détails", 1, False, "DASHED")],
+            entities=entities,
+            dimensions=[],
+            text_entities=[{'text': "Hauteur 2,4 m²", 'height': 2.5, 'layer': "Détails", 'position': (1.0, 2.0, 0.0)}],
+            blocks=[]
+        )
+        self.parser.measurements = []
+        info = self.parser.drawing_info
+        # The document the export built as one dict before it was streamed
+        return {
+            'filename': info.filename,
+            'version': info.version,
+            'units': info.units,
+            'layers': [
+                {'name': layer.name, 'color': layer.color, 'is_visible': layer.is_visible, 'line_type': layer.line_type}
+                for layer in info.layers
+            ],
+            'entities': [
+                {'entity_type': entity.entity_type, 'layer': entity.layer, 'handle': entity.handle, 'data': entity.data}
+                for entity in info.entities
+            ],
+            'dimensions': info.dimensions,
+            'text_entities': info.text_entities,
+            'blocks': info.blocks,
+            'measurements': self.parser.measurements
+        }
+
+    def _export_text(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'drawing.json')
+            self.parser.export_to_json(path)
+            with open(path, encoding='utf-8') as f:
+                return f.read()
+
+    def test_export_to_json_round_trips(self):
+        expected = self._export_fixture()
+        self.assertEqual(json.loads(self._export_text()), json.loads(json.dumps(expected)))
+
+    def test_export_to_json_matches_json_dumps(self):
+        expected = self._export_fixture()
+        stdlib_encode = json.JSONEncoder(indent=2, ensure_ascii=False).encode
+        with patch.object(dwg_parser_text, '_encode_json', stdlib_encode):
+            text = self._export_text()
+        self.assertEqual(text, json.dumps(expected, indent=2, ensure_ascii=False))
+
+    def test_dimension_value(self):
+        self.assertEqual(dwg_parser_text._dimension_value("250"), 250.0)
+        # "<>" stands for the measured length; the text itself carries no number
+        self.assertEqual(dwg_parser_text._dimension_value("<>"), 0.0)
+        self.assertEqual(dwg_parser_text._dimension_value(""), 0.0)
+
+    def test_line_lengths_kernels_agree(self):
+        starts = np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0], [5.0, 5.0, 0.0]])
+        ends = np.array([[3.0, 4.0, 0.0], [1.0, 2.0, 3.0], [2.0, 1.0, 12.0]])
+        loop = dwg_parser_text._line_lengths_loop(starts, ends)
+        vectorized = dwg_parser_text._line_lengths_numpy(starts, ends)
+        np.testing.assert_allclose(loop, vectorized)
+        np.testing.assert_allclose(loop, [5.0, 0.0, 13.0])
+
+
+class TestDWGParserSampleDrawing(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.parser = DWGParser()
+        cls.drawing_info = cls.parser.parse_file(SAMPLE_DXF)
+
+    def test_counts(self):
+        info = self.drawing_info
+        self.assertEqual(len(info.entities), 1482)
+        self.assertEqual(len(info.dimensions), 22)
+        self.assertEqual(len(info.text_entities), 94)
+
+    def test_columns_match_entity_data(self):
+        columns = self.drawing_info.columns
+        self.assertEqual(len(columns['length']), len(self.drawing_info.entities))
+        for i, entity in enumerate(self.drawing_info.entities):
+            self.assertEqual(columns['entity_type'][i], entity.entity_type)
+            self.assertEqual(columns['layer'][i], entity.layer)
+            if entity.entity_type == 'LINE':
+                self.assertEqual(columns['length'][i], entity.data['length'])
+            else:
+                self.assertTrue(np.isnan(columns['length'][i]))
+            if entity.entity_type in ('CIRCLE', 'ARC'):
+                self.assertEqual(columns['radius'][i], entity.data['radius'])
+            else:
+                self.assertTrue(np.isnan(columns['radius'][i]))
+
+    def test_dimension_values_reach_measurements(self):
+        dimension_values = [d['measurement'] for d in self.drawing_info.dimensions if d['measurement'] > 0]
+        measured = [m['value'] for m in self.parser.get_measurements() if m['type'] == 'dimension']
+        self.assertEqual(len(dimension_values), 21)
+        self.assertEqual(measured, dimension_values)
+        self.assertEqual(len(self.parser.get_measurements()), 433)
+
+    def test_raising_entity_is_skipped(self):
+        msp = ezdxf.new().modelspace()
+        line = msp.add_line((0, 0), (3, 4))
+        circle = msp.add_circle((0, 0), 2)
+        broken = MagicMock()
+        broken.dxftype.side_effect = RuntimeError("corrupt entity")
+        entities, _, _, columns = DWGParser()._extract_entities([line, broken, circle])
+        self.assertEqual([e.entity_type for e in entities], ['LINE', 'CIRCLE'])
+        self.assertEqual(entities[0].data['length'], 5.0)
+        self.assertEqual(columns['length'][0], 5.0)
+        self.assertEqual(columns['radius'][1], 2.0)
@@ -1,11 +1,16 @@
 import unittest
 from unittest.mock import patch, MagicMock
+import os
 import sys
+import tempfile
+from types import SimpleNamespace
+
+import numpy as np
 
 # Import the module under test
 import src.dwg_validator_text as dwg_validator_text
 from src.dwg_validator_text import DWGValidator, ValidationResult
-from src.dwg_parser_text import DrawingInfo, LayerInfo, EntityInfo
+from src.dwg_parser_text import DWGParser, DrawingInfo, LayerInfo, EntityInfo
 
 class MockDWGParser:
     def parse_file(self, file_path):
@@ -63,6 +68,105 @@ class TestDWGValidatorText(unittest.TestCase):
         self.assertEqual(results[0].status, "FAIL")
         self.assertIn("Could not parse", results[0].message)
 
+    def test_convert_and_stats_kernels_agree(self):
+        values = np.array([10.0, 1.0, 250.0, 50.0, 3.5])
+        units = np.array([1, 4, 2, 5, 0], dtype=np.intp)
+        factors = np.array([1.0, 12.0, 0.0393701, 0.393701, 39.3701, 1.0])
+        py_min, py_max = dwg_validator_text._convert_and_stats_py(values, units, factors)
+        np_min, np_max = dwg_validator_text._convert_and_stats_numpy(values, units, factors)
+        self.assertAlmostEqual(py_min, np_min)
+        self.assertAlmostEqual(py_max, np_max)
+        self.assertAlmostEqual(py_min, 3.5)
+        self.assertAlmostEqual(py_max, 120.0)
+
+    def test_check_against_building_codes_mixed_units(self):
+        code_parser = SimpleNamespace(structure=SimpleNamespace(measurements=[
+            {'value': 10, 'unit': 'feet'},
+            {'value': 1, 'unit': 'meters'},
+            {'value': 30, 'unit': 'furlongs'},  # unknown unit, factor 1.0
+        ]))
+        dwg_parser = MagicMock()
+        dwg_parser.get_measurements.return_value = [{'value': 31.0}, {'value': 118.0}, {'value': 'n/a'}]
+        validator = DWGValidator(dwg_parser=dwg_parser, building_code_parser=code_parser)
+        result = validator._check_against_building_codes(MockDWGParser().parse_file("dummy.dxf"))
+        self.assertEqual(result.status, "PASS")
+        self.assertEqual(result.details['code_measurements'], 3)
+        self.assertEqual(result.details['drawing_measurements'], 2)
+        code_min, code_max = result.details['code_range']
+        self.assertAlmostEqual(code_min, 30.0)
+        self.assertAlmostEqual(code_max, 120.0)
+
+    def test_encoded_code_measurements_follow_appends(self):
+        measurements = [{'value': 10, 'unit': 'feet'}]
+        values, units = self.validator._encode_code_measurements(measurements)
+        self.assertIs(self.validator._encode_code_measurements(measurements)[0], values)
+        measurements.append({'value': 2, 'unit': 'meters'})
+        values, units = self.validator._encode_code_measurements(measurements)
+        self.assertEqual(values.tolist(), [10.0, 2.0])
+        self.assertEqual(units.tolist(), [1, 4])
+
+    def test_dimension_completeness_measurement_texts(self):
+        measurement_texts = ["5 m", "MIN 2", "3'-6\"", "12 FT", "2,4 m\u00b2", "\u2082 in", "\u2075 ft"]
+        other_texts = ["\u207f m", "\u207a m", "\u207d m \u207e", "\u2071 ft", "LEVEL 3", "Room"]
+        drawing_info = MockDWGParser().parse_file("dummy.dxf")
+        drawing_info.dimensions = []
+        drawing_info.text_entities = [
+            {'text': text, 'height': 0.2, 'layer': "A-WALL", 'position': (0, 0, 0)}
+            for text in measurement_texts + other_texts
+        ]
+        result = self.validator._check_dimension_completeness(drawing_info)
+        self.assertEqual(result.details['total_measurements'], len(measurement_texts))
+        self.assertEqual(result.details['measurement_texts'], measurement_texts[:5])
+        self.assertEqual(result.status, "WARNING")
+
+    def test_failing_check_keeps_other_results_in_order(self):
+        expected = [
+            dwg_validator_text.CHECK_UNITS,
+            dwg_validator_text.CHECK_LAYERS,
+            dwg_validator_text.CHECK_EXCEPTION,
+            dwg_validator_text.CHECK_TEXT,
+            dwg_validator_text.CHECK_SCALE,
+            dwg_validator_text.CHECK_ENTITIES,
+        ]
+        for threshold in (DWGValidator.PARALLEL_THRESHOLD, 0):
+            with self.subTest(parallel_threshold=threshold):
+                validator = DWGValidator(dwg_parser=MagicMock())
+                validator.PARALLEL_THRESHOLD = threshold
+                with patch.object(validator, '_check_dimension_completeness', side_effect=RuntimeError("boom")):
+                    results = validator.validate_file(drawing_info=MockDWGParser().parse_file("dummy.dxf"))
+                self.assertEqual([r.check_name for r in results], expected)
+                self.assertEqual(results[2].status, "FAIL")
+                self.assertIn("boom", results[2].message)
+
+    def _export_drawings(self, directory, units_list):
+        paths = []
+        for i, units in enumerate(units_list):
+            parser = DWGParser()
+            parser.drawing_info = MockDWGParser().parse_file("dummy.dxf")
+            parser.drawing_info.units = units
+            path = os.path.join(directory, f"drawing_{i}.json")
+            parser.export_to_json(path)
+            paths.append(path)
+        return paths
+
+    def test_validate_batch(self):
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self._export_drawings(directory, ["meters", "furlongs"])
+            for workers in (1, 2):
+                with self.subTest(workers=workers):
+                    summaries = dwg_validator_text.validate_batch(paths, workers=workers)
+                    self.assertEqual(len(summaries), 2)
+                    for summary in summaries:
+                        self.assertIsInstance(summary, dict)
+                        self.assertIn('overall_status', summary)
+                    units = [summary['results'][0]['details']['units'] for summary in summaries]
+                    self.assertEqual(units, ["meters", "furlongs"])
+
+    def test_validate_batch_empty(self):
+        with patch.object(dwg_validator_text, '_init_batch_worker') as init:
+            self.assertEqual(dwg_validator_text.validate_batch([], building_code_file="code.txt"), [])
+        init.assert_not_called()
+
     # Add more tests for other methods as needed, using mocks for file I/O
 
 
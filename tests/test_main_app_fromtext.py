@@ -12,6 +12,45 @@ class TestMainAppFromText(unittest.TestCase):
     def test_main_function_exists(self):
         self.assertTrue(hasattr(main_app_fromtext, 'main') or hasattr(main_app_fromtext, 'run') or hasattr(main_app_fromtext, '__main__'))
 
+    def test_paginate(self):
+        paginate = main_app_fromtext._paginate
+        self.assertEqual(list(paginate(range(6), 3)), [[0, 1, 2], [3, 4, 5]])
+        self.assertEqual(list(paginate(range(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+        self.assertEqual(list(paginate([], 3)), [])
+
+    def test_set_text_pages_through_load_more(self):
+        app = main_app_fromtext.BuildingCodeDWGApp.__new__(main_app_fromtext.BuildingCodeDWGApp)
+        app.PAGE_SIZE = 2
+        app._pending_pages = {}
+        app.notebook = MagicMock()
+        app.notebook.index.return_value = 0
+        app.load_more_button = MagicMock()
+        widget = MagicMock()
+        widget.tag_ranges.return_value = ()
+        app._tab_texts = (widget,)
+
+        app._set_text(widget, ["a\n", "b\n", "c\n"])
+        widget.insert.assert_any_call(main_app_fromtext.tk.END, "a\nb\n")
+        self.assertIn(widget, app._pending_pages)
+        app.load_more_button.state.assert_called_with(['!disabled'])
+
+        app._load_more()
+        widget.insert.assert_called_with(main_app_fromtext.tk.END, "c\n")
+        self.assertNotIn(widget, app._pending_pages)
+        app.load_more_button.state.assert_called_with(['disabled'])
+
+    def test_gui_action_reports_handler_errors(self):
+        @main_app_fromtext._gui_action("Working...", "Error working")
+        def handler(app):
+            raise ValueError("bad file")
+        app = main_app_fromtext.BuildingCodeDWGApp.__new__(main_app_fromtext.BuildingCodeDWGApp)
+        app._action_buttons = ()
+        app.status_var = MagicMock()
+        with patch.object(main_app_fromtext.messagebox, 'showerror') as showerror:
+            handler(app)
+        showerror.assert_called_once_with("Error", "Error working: bad file")
+        app.status_var.set.assert_called_once_with("Error working")
+
     # Add more tests for public functions/classes as needed
 
 if __name__ == '__main__':